@@ -6,6 +6,20 @@ Test all input components individually
 import time
 from hardware_config import get_hardware
 
+TEST_DURATION_MS = 10000  # How long each interactive test waits for input
+IDLE_SLICE_MS = 20        # Sleep granularity while waiting for an IRQ
+JOYSTICK_SAMPLE_MS = 100  # Analog axes have no IRQ, sample them at this rate
+JOYSTICK_MOVE_LIMIT = 9830  # 0.3 of full deflection, in raw ADC counts
+TOUCH_DOT = bytearray(b'\xFF\xE0' * 100)  # 10x10 yellow dot, RGB565
+
+def idle_until(deadline, slice_ms=IDLE_SLICE_MS):
+    """Sleep one slice (never past deadline); returns False once deadline has passed"""
+    remaining = time.ticks_diff(deadline, time.ticks_ms())
+    if remaining <= 0:
+        return False
+    time.sleep_ms(min(remaining, slice_ms))
+    return True
+
 def test_all_hardware():
     """Test all hardware components"""
     print("=== MUSLIM COMPANION HARDWARE TEST ===")
@@ -20,11 +34,11 @@ def test_all_hardware():
         print("\n--- DISPLAY TEST ---")
         try:
             hw.display.fill(0xF800)  # Red
-            time.sleep(0.5)
+            time.sleep_ms(500)
             hw.display.fill(0x07E0)  # Green  
-            time.sleep(0.5)
+            time.sleep_ms(500)
             hw.display.fill(0x001F)  # Blue
-            time.sleep(0.5)
+            time.sleep_ms(500)
             hw.display.fill(0x0000)  # Black
             print("✓ Display test successful")
         except Exception as e:
@@ -33,22 +47,21 @@ def test_all_hardware():
         # Test joystick
         print("\n--- JOYSTICK TEST ---")
         print("Move joystick and press center button (10 seconds)...")
-        start_time = time.time()
         joystick_working = False
+        deadline = time.ticks_add(time.ticks_ms(), TEST_DURATION_MS)
         
-        while time.time() - start_time < 10:
+        while True:
             try:
-                # Raw values
-                raw = hw.joystick.read_raw()
-                norm = hw.joystick.read_normalized()
-                direction = hw.joystick.get_direction()
-                button = hw.joystick.get_button_press()
-                
-                if abs(norm['x']) > 0.3 or abs(norm['y']) > 0.3:
-                    print(f"Joystick movement: {direction} (x:{norm['x']:.2f}, y:{norm['y']:.2f})")
+                # Axes are analog so they still have to be sampled; compare
+                # integer offsets from center so a resting stick costs no float math
+                x, y = hw.joystick.read_raw_signed()
+                if abs(x) > JOYSTICK_MOVE_LIMIT or abs(y) > JOYSTICK_MOVE_LIMIT:
+                    direction = hw.joystick.get_direction()
+                    print("Joystick movement:", direction, "x:", x, "y:", y)
                     joystick_working = True
                     
-                if button:
+                # The joystick driver latches center presses from its pin IRQ
+                if hw.joystick.get_button_press():
                     print("Joystick button pressed!")
                     joystick_working = True
                     
@@ -56,7 +69,8 @@ def test_all_hardware():
                 print(f"Joystick error: {e}")
                 break
                 
-            time.sleep(0.1)
+            if not idle_until(deadline, JOYSTICK_SAMPLE_MS):
+                break
         
         if joystick_working:
             print("✓ Joystick test successful")
@@ -66,10 +80,12 @@ def test_all_hardware():
         # Test physical buttons
         print("\n--- PHYSICAL BUTTONS TEST ---")
         print("Press Button 1 and Button 2 (10 seconds)...")
-        start_time = time.time()
         buttons_working = False
+        deadline = time.ticks_add(time.ticks_ms(), TEST_DURATION_MS)
         
-        while time.time() - start_time < 10:
+        # Buttons are edge-captured by their own IRQs, so update() only
+        # touches the GPIOs after an edge
+        while idle_until(deadline):
             try:
                 hw.buttons.update()
                 
@@ -84,8 +100,6 @@ def test_all_hardware():
             except Exception as e:
                 print(f"Buttons error: {e}")
                 break
-                
-            time.sleep(0.1)
         
         if buttons_working:
             print("✓ Physical buttons test successful")
@@ -95,24 +109,23 @@ def test_all_hardware():
         # Test touch screen
         print("\n--- TOUCH SCREEN TEST ---")
         print("Touch the screen anywhere (10 seconds)...")
-        start_time = time.time()
         touch_working = False
+        deadline = time.ticks_add(time.ticks_ms(), TEST_DURATION_MS)
         
-        while time.time() - start_time < 10:
+        # get_touch() only touches the I2C bus after the GT911 INT pin fires
+        while idle_until(deadline):
             try:
                 touch_data = hw.touch.get_touch()
                 if touch_data:
                     x, y = touch_data[0], touch_data[1]
-                    print(f"Touch detected: X={x}, Y={y}")
+                    print("Touch detected: X=", x, "Y=", y)
                     # Draw dot at touch location
-                    hw.display.fill_rect(x-5, y-5, 10, 10, 0xFFE0)  # Yellow dot
+                    hw.display.blit(x-5, y-5, 10, 10, TOUCH_DOT)  # Yellow dot
                     touch_working = True
                     
             except Exception as e:
                 print(f"Touch error: {e}")
                 break
-                
-            time.sleep(0.1)
         
         if touch_working:
             print("✓ Touch screen test successful")
@@ -124,9 +137,9 @@ def test_all_hardware():
         try:
             print("Playing test tones...")
             hw.play_tone(1000, 200)  # 1kHz for 200ms
-            time.sleep(0.3)
+            time.sleep_ms(300)
             hw.play_tone(2000, 200)  # 2kHz for 200ms
-            time.sleep(0.3)
+            time.sleep_ms(300)
             hw.play_tone(500, 200)   # 500Hz for 200ms
             print("✓ Buzzer test successful")
         except Exception as e:
@@ -3,24 +3,52 @@ Button Driver for GeeekPi GPIO Expansion Module
 Handles the two physical buttons with debouncing and feedback
 """
 
-from machine import Pin
+from machine import Pin, mem32
+from micropython import const
+import micropython
 import time
 
+# Lets a hard ISR report an exception (e.g. full schedule queue) without allocating
+micropython.alloc_emergency_exception_buf(100)
+
+# Longest single sleep while waiting for a press; the pin IRQ latches the edge
+# meanwhile, so this only bounds how late it is noticed
+MAX_IDLE_MS = 20
+
+# SIO GPIO_IN register (same address on RP2040 and RP2350): one bit per GPIO 0-29
+_SIO_GPIO_IN = const(0xD0000004)
+
+def _sleep_until_edge(edge_pending, remaining_ms):
+    """Sleep one idle slice (time.sleep_ms - lightsleep drops the USB REPL)"""
+    if edge_pending:
+        time.sleep_ms(1)  # Edge pending, waiting out the debounce window
+    else:
+        time.sleep_ms(min(remaining_ms, MAX_IDLE_MS))
+
 class Button:
-    def __init__(self, pin_num, pull_up=True, active_low=True):
+    def __init__(self, pin_num, pull_up=True, active_low=True, track_release=False):
         """
         Initialize a button
         Args:
             pin_num: GPIO pin number
             pull_up: Use internal pull-up resistor
             active_low: Button is active low (pressed = 0)
+            track_release: Also interrupt on the release edge; otherwise a
+                held button is polled for release by update()
         """
         self.pin = Pin(pin_num, Pin.IN, Pin.PULL_UP if pull_up else Pin.PULL_DOWN)
+        self.pin_num = pin_num
         self.active_low = active_low
-        self.last_state = self.pin.value()
+        self.track_release = track_release
+        self.last_state = self._get_state()
         self.pressed = False
         self.released = False
         
+        # Events latched by _poll() until the next update() publishes them
+        self._press_latch = False
+        self._release_latch = False
+        self._long_latch = False
+        
         # Debouncing
         self.debounce_time = 50  # ms
         self.last_change_time = 0
@@ -30,35 +58,86 @@ class Button:
         self.long_press_time = 1000  # ms for long press
         self.long_pressed = False
         
+        # Optional deferred edge handler, run via micropython.schedule
+        # (a pre-bound method, so scheduling it from the ISR never allocates)
+        self._on_edge = None
+        self._index = 0
+        
+        # Edge flag set from the pin IRQ (a bytearray so the ISR never allocates)
+        self._flag = bytearray(1)
+        if active_low:
+            press_edge, release_edge = Pin.IRQ_FALLING, Pin.IRQ_RISING
+        else:
+            press_edge, release_edge = Pin.IRQ_RISING, Pin.IRQ_FALLING
+        trigger = press_edge | (release_edge if track_release else 0)
+        self.pin.irq(trigger=trigger, handler=self._isr, hard=True)
+        
+    def _isr(self, pin):
+        """Hard pin IRQ handler - records the edge and defers all real work"""
+        self._flag[0] = 1
+        if self._on_edge is not None:
+            try:
+                micropython.schedule(self._on_edge, self._index)
+            except RuntimeError:
+                pass  # Schedule queue full; the next update() still sees the flag
+        
     def _get_state(self):
         """Get current logical state (True = pressed)"""
         raw_state = self.pin.value()
         return not raw_state if self.active_low else raw_state
         
-    def update(self):
-        """Update button state - call this regularly"""
-        current_time = time.ticks_ms()
-        current_state = self._get_state()
+    def _poll(self, current_time, raw_state=None):
+        """
+        Run the debounce state machine if an edge is pending
+        Args:
+            current_time: ticks_ms() timestamp for this update
+            raw_state: Pin level already read by the caller (read here if None)
+        Returns True if a new press was detected
+        """
+        # Nothing to do unless the pin IRQ saw an edge, or the button is held
+        # and its release edge has no IRQ (read the pin to catch the release)
+        if not self._flag[0] and (self.track_release or not self.last_state):
+            return False
+            
+        # Relaxing-timer debounce: act on the first edge immediately, then
+        # ignore the pin until the contacts have had time to settle. The flag
+        # is kept so the settled state is still read once the window ends.
+        if time.ticks_diff(current_time, self.last_change_time) < self.debounce_time:
+            return False
+            
+        self._flag[0] = 0
+        if raw_state is None:
+            current_state = self._get_state()
+        else:
+            current_state = not raw_state if self.active_low else raw_state
+        if current_state == self.last_state:
+            return False
+            
+        if current_state:  # Button pressed
+            self._press_latch = True
+            self.press_start_time = current_time
+        else:  # Button released
+            self._release_latch = True
+            if time.ticks_diff(current_time, self.press_start_time) >= self.long_press_time:
+                self._long_latch = True
         
-        # Reset flags
-        self.pressed = False
-        self.released = False
+        self.last_state = current_state
+        self.last_change_time = current_time
+        return current_state
         
-        # Debouncing
-        if current_state != self.last_state:
-            if time.ticks_diff(current_time, self.last_change_time) > self.debounce_time:
-                # State actually changed
-                if current_state:  # Button pressed
-                    self.pressed = True
-                    self.press_start_time = current_time
-                    self.long_pressed = False
-                else:  # Button released
-                    self.released = True
-                    if time.ticks_diff(current_time, self.press_start_time) >= self.long_press_time:
-                        self.long_pressed = True
-                
-                self.last_state = current_state
-                self.last_change_time = current_time
+    def _publish(self):
+        """Expose latched events as this update's pressed/released/long_pressed flags"""
+        self.pressed = self._press_latch
+        self.released = self._release_latch
+        self.long_pressed = self._long_latch
+        self._press_latch = False
+        self._release_latch = False
+        self._long_latch = False
+        
+    def update(self):
+        """Update button state - call this regularly"""
+        self._poll(time.ticks_ms())
+        self._publish()
         
     def is_pressed(self):
         """Check if button was just pressed this update"""
@@ -73,11 +152,11 @@ class Button:
         return self._get_state()
         
     def is_long_pressed(self):
-        """Check if button was long pressed (held > 1 second)"""
+        """Check if button was just released after a long press (held > 1 second)"""
         return self.long_pressed
         
     def wait_for_press(self, timeout_ms=None):
-        """Wait for button press"""
+        """Wait for button press, sleeping until the pin IRQ fires"""
         start_time = time.ticks_ms()
         
         while True:
@@ -85,10 +164,13 @@ class Button:
             if self.is_pressed():
                 return True
                 
-            if timeout_ms and time.ticks_diff(time.ticks_ms(), start_time) > timeout_ms:
-                return False
-                
-            time.sleep_ms(10)
+            remaining = MAX_IDLE_MS
+            if timeout_ms:
+                remaining = timeout_ms - time.ticks_diff(time.ticks_ms(), start_time)
+                if remaining <= 0:
+                    return False
+                    
+            _sleep_until_edge(self._flag[0], remaining)
 
 
 class ButtonManager:
@@ -108,17 +190,39 @@ class ButtonManager:
         self.select_button = self.button1  # Button 1 = Select/OK
         self.back_button = self.button2    # Button 2 = Back/Cancel
         
-    def update(self):
-        """Update all buttons"""
-        self.button1.update()
-        self.button2.update()
+        # Debounce and beep right after an edge, outside the hard ISR
+        self._buttons = (self.button1, self.button2)
+        self._handle_ref = self._scheduled_handle
+        for index, button in enumerate(self._buttons):
+            button._index = index
+            button._on_edge = self._handle_ref
         
-        # Play beep on button press
+    def _beep(self, index):
+        """Play the feedback beep for a newly pressed button"""
         if self.buzzer_callback:
-            if self.button1.is_pressed():
+            if index == 0:
                 self.buzzer_callback(800, 100)  # Select beep
-            elif self.button2.is_pressed():
+            else:
                 self.buzzer_callback(600, 150)  # Back beep (lower tone)
+        
+    def _scheduled_handle(self, index):
+        """Deferred edge handler - runs via micropython.schedule, may allocate"""
+        if self._buttons[index]._poll(time.ticks_ms()):
+            self._beep(index)
+        
+    def update(self):
+        """Update all buttons"""
+        # Catch edges that were still debouncing when their handler ran.
+        # Both pins are sampled from a single SIO register read.
+        gpio_in = mem32[_SIO_GPIO_IN]
+        current_time = time.ticks_ms()
+        if self.button1._poll(current_time, (gpio_in >> self.button1.pin_num) & 1):
+            self._beep(0)
+        if self.button2._poll(current_time, (gpio_in >> self.button2.pin_num) & 1):
+            self._beep(1)
+            
+        self.button1._publish()
+        self.button2._publish()
                 
     def get_select_press(self):
         """Check if select button was pressed"""
@@ -138,7 +242,7 @@ class ButtonManager:
         
     def wait_for_any_button(self, timeout_ms=None):
         """
-        Wait for any button press
+        Wait for any button press, sleeping until a button IRQ fires
         Returns: 'select', 'back', or None if timeout
         """
         start_time = time.ticks_ms()
@@ -151,7 +255,10 @@ class ButtonManager:
             elif self.get_back_press():
                 return 'back'
                 
-            if timeout_ms and time.ticks_diff(time.ticks_ms(), start_time) > timeout_ms:
-                return None
-                
-            time.sleep_ms(10)
\ No newline at end of file
+            remaining = MAX_IDLE_MS
+            if timeout_ms:
+                remaining = timeout_ms - time.ticks_diff(time.ticks_ms(), start_time)
+                if remaining <= 0:
+                    return None
+                    
+            _sleep_until_edge(self.button1._flag[0] or self.button2._flag[0], remaining)
\ No newline at end of file
@@ -4,14 +4,16 @@ Display helper functions for text rendering
 
 from lib.font import Font
 
+# Shared font instance - Font is stateless, so one copy serves every call
+_FONT = Font()
+
 def draw_text(display, text, x, y, color, size=1):
     """Draw text on display using Font class"""
-    font = Font()
-    font.draw_text(display, text, x, y, size, color)
+    _FONT.draw_text(display, text, x, y, size, color)
 
 def draw_text_centered(display, text, y, width, color, size=1):
     """Draw centered text"""
-    font = Font()
+    font = _FONT
     text_width = font.get_text_width(text, size)
     x = (width - text_width) // 2
     font.draw_text(display, text, x, y, size, color)
\ No newline at end of file
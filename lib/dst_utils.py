@@ -5,6 +5,18 @@ Handles DST calculations for US locations
 
 import time
 
+# Month offsets for Sakamoto's weekday algorithm
+_SAKAMOTO_T = (0, 3, 2, 5, 0, 3, 5, 1, 4, 6, 2, 4)
+
+# Memoized DST boundaries: [year, second Sunday of March, first Sunday of November]
+_DST_CACHE = [None, 0, 0]
+
+# Memoized DST state for the last day checked: [year, month, day, dst_active]
+_DAY_CACHE = [None, 0, 0, False]
+
+# Timezone display prefixes, indexed by (offset < 0)
+_SIGN = ("UTC+", "UTC")
+
 def is_dst_active(year, month, day):
     """
     Check if Daylight Saving Time is active for a given date in the US
@@ -28,14 +40,16 @@ def is_dst_active(year, month, day):
     if month > 3 and month < 11:
         return True
         
-    # Calculate DST start and end dates for the year
-    dst_start = get_second_sunday_march(year)
-    dst_end = get_first_sunday_november(year)
+    # DST start and end dates only change once a year
+    if _DST_CACHE[0] != year:
+        _DST_CACHE[0] = year
+        _DST_CACHE[1] = get_second_sunday_march(year)
+        _DST_CACHE[2] = get_first_sunday_november(year)
     
     if month == 3:
-        return day >= dst_start
+        return day >= _DST_CACHE[1]
     elif month == 11:
-        return day < dst_end
+        return day < _DST_CACHE[2]
     else:
         return True
 
@@ -70,32 +84,21 @@ def get_first_sunday_november(year):
 
 def get_weekday(year, month, day):
     """
-    Get weekday for a given date using Zeller's congruence
+    Get weekday for a given date using Sakamoto's algorithm
     Returns: 0=Sunday, 1=Monday, 2=Tuesday, ..., 6=Saturday
     """
     if month < 3:
-        month += 12
         year -= 1
-    
-    # Zeller's congruence formula
-    q = day
-    m = month
-    k = year % 100
-    j = year // 100
-    
-    h = (q + ((13 * (m + 1)) // 5) + k + (k // 4) + (j // 4) - 2 * j) % 7
-    
-    # Convert to our format (0=Sunday)
-    weekday = (h + 5) % 7
-    return weekday
+    return (year + year // 4 - year // 100 + year // 400 + _SAKAMOTO_T[month - 1] + day) % 7
 
-def get_current_timezone_offset(base_timezone, daylight_saving_enabled=True):
+def get_current_timezone_offset(base_timezone, daylight_saving_enabled=True, now=None):
     """
     Get the current timezone offset accounting for DST
     
     Args:
         base_timezone: Base timezone offset (e.g., -5 for EST)
         daylight_saving_enabled: Whether DST is enabled in settings
+        now: Optional time.localtime() tuple the caller already fetched
         
     Returns:
         int: Current timezone offset
@@ -104,13 +107,19 @@ def get_current_timezone_offset(base_timezone, daylight_saving_enabled=True):
         return base_timezone
         
     # Get current date
-    current_time = time.localtime()
+    current_time = now if now is not None else time.localtime()
     year = current_time[0]
     month = current_time[1] 
     day = current_time[2]
     
-    # Check if DST is currently active
-    if is_dst_active(year, month, day):
+    # Check if DST is currently active (reuse the answer for the rest of the day)
+    if _DAY_CACHE[0] != year or _DAY_CACHE[1] != month or _DAY_CACHE[2] != day:
+        _DAY_CACHE[0] = year
+        _DAY_CACHE[1] = month
+        _DAY_CACHE[2] = day
+        _DAY_CACHE[3] = is_dst_active(year, month, day)
+    
+    if _DAY_CACHE[3]:
         return base_timezone + 1  # Add 1 hour for DST
     else:
         return base_timezone
@@ -126,21 +135,19 @@ def format_timezone_display(base_timezone, daylight_saving_enabled=True):
     Returns:
         str: Formatted timezone string
     """
-    current_offset = get_current_timezone_offset(base_timezone, daylight_saving_enabled)
+    # One localtime() per render; the offset already tells us whether DST applies
+    current_offset = get_current_timezone_offset(base_timezone, daylight_saving_enabled,
+                                                 time.localtime())
     
     if daylight_saving_enabled:
-        current_time = time.localtime()
-        if is_dst_active(current_time[0], current_time[1], current_time[2]):
+        if current_offset != base_timezone:
             dst_status = " (DST)"
         else:
             dst_status = " (STD)"
     else:
         dst_status = ""
         
-    if current_offset >= 0:
-        return f"UTC+{current_offset}{dst_status}"
-    else:
-        return f"UTC{current_offset}{dst_status}"
+    return _SIGN[current_offset < 0] + str(current_offset) + dst_status
 
 # Example timezone mappings for US cities
 US_TIMEZONES = {
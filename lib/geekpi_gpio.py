@@ -5,13 +5,15 @@ Vendor-specific implementation for GeeekPi 3.5" Display with GPIO expansion
 
 import time
 import gc
-from machine import Pin, SPI, I2C, RTC
+from machine import Pin, SPI, I2C, RTC, PWM, Timer
 
-# Import display and touch drivers
-from lib.st7796 import ST7796
-from lib.gt911 import GT911
-from lib.joystick import Joystick
-from lib.buttons import ButtonManager
+# Startup beeps: three ascending tones, played from a Timer chain
+_BOOT_FREQS = (800, 1000, 1200)  # Hz
+_BOOT_TONE_MS = 200
+_BOOT_GAP_MS = 50
+
+# Driver modules are imported inside __init__ so they are only loaded
+# when this vendor is actually selected in hardware_config.py
 
 class GeeekPiHardware:
     """
@@ -52,46 +54,51 @@ class GeeekPiHardware:
     BLUE_LED_1 = 16   # GP16 (Blue LED)
     BLUE_LED_2 = 17   # GP17 (Blue LED)
     
-    # Legacy settings button (for backward compatibility)
-    SETTINGS_BUTTON = 12  # GP12 (now used for RGB LED)
-    
     def __init__(self):
         """Initialize all hardware components"""
         print("Initializing GeeekPi Hardware...")
         
         # Initialize display
+        from lib.st7796 import ST7796
         self.spi = SPI(0, baudrate=40000000, polarity=0, phase=0,
                       sck=Pin(self.SPI_CLK), mosi=Pin(self.SPI_MOSI))
         self.display = ST7796(self.spi, cs=Pin(self.SPI_CS, Pin.OUT),
                               dc=Pin(self.SPI_DC, Pin.OUT),
                               rst=Pin(self.SPI_RST, Pin.OUT),
                               width=self.DISPLAY_WIDTH, height=self.DISPLAY_HEIGHT)
+        gc.collect()
         
         # Initialize touch screen with error handling
+        from lib.gt911 import GT911
+        self.touch_int_pin = Pin(self.TOUCH_INT, Pin.IN)
         try:
             self.i2c = I2C(0, scl=Pin(self.I2C_SCL), sda=Pin(self.I2C_SDA), freq=400000)
             self.touch = GT911(self.i2c, rst=Pin(self.TOUCH_RST, Pin.OUT),
-                               int_pin=Pin(self.TOUCH_INT, Pin.IN))
+                               int_pin=self.touch_int_pin)
             print("Touch screen initialized")
         except Exception as e:
             print(f"Touch screen initialization failed: {e}")
             self.touch = None  # Set to None if initialization fails
+        gc.collect()
+        
+        # Initialize buzzer (PWM generates the tone in hardware)
+        self.buzzer = PWM(Pin(self.BUZZER_PIN))
+        self.buzzer.duty_u16(0)
         
-        # Initialize buzzer
-        self.buzzer = Pin(self.BUZZER_PIN, Pin.OUT)
+        # One-shot timer that steps the boot sound while the CPU keeps booting
+        self._boot_timer = Timer()
+        self._boot_step = 0
+        self._boot_step_ref = self._next_boot_tone
         
         # Initialize joystick
+        from lib.joystick import Joystick
         self.joystick = Joystick(self.JOYSTICK_X, self.JOYSTICK_Y, self.JOYSTICK_SW)
         
         # Initialize buttons with buzzer callback
+        from lib.buttons import ButtonManager
         self.buttons = ButtonManager(self.BUTTON_1, self.BUTTON_2, 
                                     buzzer_callback=self.play_tone)
         
-        # Initialize legacy settings button (if using RGB LED pin as button)
-        self.settings_button = Pin(self.SETTINGS_BUTTON, Pin.IN, Pin.PULL_UP)
-        self.last_button_state = 1
-        self.button_pressed = False
-        
         # Initialize LEDs (optional, for future use)
         self.blue_led_1 = Pin(self.BLUE_LED_1, Pin.OUT)
         self.blue_led_2 = Pin(self.BLUE_LED_2, Pin.OUT)
@@ -101,26 +108,61 @@ class GeeekPiHardware:
     def play_tone(self, frequency, duration_ms):
         """Play a tone at specified frequency for specified duration"""
         if frequency == 0:
-            time.sleep(duration_ms / 1000)
+            time.sleep_ms(duration_ms)
             return
             
-        period = 1000000 // frequency  # Period in microseconds
-        cycles = (duration_ms * 1000) // period
-        
-        for _ in range(cycles):
-            self.buzzer.on()
-            time.sleep_us(period // 2)
-            self.buzzer.off()
-            time.sleep_us(period // 2)
+        self.buzzer.freq(frequency)
+        self.buzzer.duty_u16(32768)  # 50% duty square wave
+        time.sleep_ms(duration_ms)
+        self.buzzer.duty_u16(0)
     
     def play_boot_sound(self, enabled=True):
-        """Play a startup sound sequence"""
+        """Start the startup sound sequence (returns immediately)"""
         if enabled:
-            # Play three ascending beeps
-            frequencies = [800, 1000, 1200]  # Hz
-            for freq in frequencies:
-                self.play_tone(freq, 200)  # 200ms each
-                time.sleep(0.05)  # 50ms gap
+            self._boot_step = 0
+            self._next_boot_tone(None)
+    
+    def _next_boot_tone(self, timer):
+        """Timer callback: alternately start a boot tone and end it with a gap"""
+        step = self._boot_step
+        self._boot_step = step + 1
+        
+        if step & 1:
+            # Tone finished - silence, then wait out the gap if more tones follow
+            self.buzzer.duty_u16(0)
+            if (step >> 1) + 1 < len(_BOOT_FREQS):
+                self._boot_timer.init(period=_BOOT_GAP_MS, mode=Timer.ONE_SHOT,
+                                      callback=self._boot_step_ref)
+        else:
+            self.buzzer.freq(_BOOT_FREQS[step >> 1])
+            self.buzzer.duty_u16(32768)
+            self._boot_timer.init(period=_BOOT_TONE_MS, mode=Timer.ONE_SHOT,
+                                  callback=self._boot_step_ref)
+    
+    def poll_inputs(self, timeout_ms=50):
+        """
+        Sample joystick, buttons and touch in one pass
+        Waits up to timeout_ms for the stick to move; the touch controller is
+        only read over I2C when its INT pin has signalled a report
+        Returns: (direction, select, back, touch_xy) - back includes the
+        joystick center press, touch_xy is (x, y) or None
+        """
+        direction = self.joystick.wait_for_direction(timeout_ms=timeout_ms)
+        
+        buttons = self.buttons
+        buttons.update()
+        select = buttons.get_select_press()
+        back = self.joystick.get_button_press()
+        back = buttons.get_back_press() or back
+        
+        touch_xy = None
+        touch = self.touch
+        if touch and touch.pending:
+            touch_data = touch.get_touch()
+            if touch_data:
+                touch_xy = (touch_data[0], touch_data[1])
+                
+        return direction, select, back, touch_xy
     
     def play_prayer_alert(self, enabled=True, duration=5):
         """Play prayer time alert sound"""
@@ -128,20 +170,7 @@ class GeeekPiHardware:
             # Play a gentle prayer alert tone
             for _ in range(duration):
                 self.play_tone(1000, 500)  # 1kHz for 500ms
-                time.sleep(0.5)  # 500ms silence
-    
-    def check_legacy_button(self):
-        """Check legacy settings button state"""
-        current_button_state = self.settings_button.value()
-        if self.last_button_state == 1 and current_button_state == 0:
-            self.button_pressed = True
-            time.sleep(0.05)  # Debounce
-        self.last_button_state = current_button_state
-        
-        if self.button_pressed:
-            self.button_pressed = False
-            return True
-        return False
+                time.sleep_ms(500)  # 500ms silence
     
     def get_display_size(self):
         """Return display dimensions"""
@@ -153,5 +182,7 @@ class GeeekPiHardware:
         self.blue_led_1.off()
         self.blue_led_2.off()
         # Turn off buzzer
-        self.buzzer.off()
+        self._boot_timer.deinit()
+        self.buzzer.duty_u16(0)
+        self.buzzer.deinit()
         print("GeeekPi Hardware cleaned up")
\ No newline at end of file
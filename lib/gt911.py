@@ -3,7 +3,9 @@ GT911 Capacitive Touch Controller Driver for MicroPython
 I2C interface at address 0x5D
 """
 
+import array
 import time
+from machine import Pin
 from micropython import const
 
 # GT911 I2C Address
@@ -114,6 +116,16 @@ GT911_POINT_5 = const(0x816F)
 
 # Touch point structure size
 GT911_POINT_SIZE = const(8)
+GT911_MAX_POINTS = const(5)
+
+# Byte offset of each point record within a bulk read starting at GT911_POINT_1
+_POINT_OFFSETS = (
+    GT911_POINT_1 - GT911_POINT_1,
+    GT911_POINT_2 - GT911_POINT_1,
+    GT911_POINT_3 - GT911_POINT_1,
+    GT911_POINT_4 - GT911_POINT_1,
+    GT911_POINT_5 - GT911_POINT_1,
+)
 
 class GT911:
     def __init__(self, i2c, rst=None, int_pin=None, width=320, height=480):
@@ -123,7 +135,19 @@ class GT911:
         self.width = width
         self.height = height
         self.touched = False
-        self.touch_points = []
+        
+        # Latest touch points, one array per field (filled in place by get_touch)
+        self._tp_id = array.array('H', [0] * GT911_MAX_POINTS)
+        self._tp_x = array.array('H', [0] * GT911_MAX_POINTS)
+        self._tp_y = array.array('H', [0] * GT911_MAX_POINTS)
+        self._tp_size = array.array('H', [0] * GT911_MAX_POINTS)
+        self._tp_n = 0
+        
+        # Reusable read buffers so polling does not allocate
+        self._status_buf = bytearray(1)
+        self._byte_buf = bytearray(1)
+        self._points_buf = bytearray(GT911_MAX_POINTS * GT911_POINT_SIZE)
+        self._points_mv = memoryview(self._points_buf)
         
         # Initialize pins
         if self.rst:
@@ -134,18 +158,33 @@ class GT911:
         # Initialize touch controller
         self.init_touch()
         
+        # GT911 pulses INT when a new report is ready; only then read the bus.
+        # Without an INT pin, every get_touch() polls the status register.
+        self._touch_pending = bytearray(1)
+        if self.int_pin:
+            self.int_pin.irq(trigger=Pin.IRQ_FALLING, handler=self._on_touch_irq, hard=True)
+        
+    def _on_touch_irq(self, pin):
+        """Hard IRQ handler for the INT pin - just flag the pending report"""
+        self._touch_pending[0] = 1
+        
     def write_reg(self, reg, data):
-        """Write data to register"""
+        """Write data (a byte value or buffer) to register (16-bit address)"""
+        # The driver sends the address itself; a byte value goes through a
+        # reused 1-byte buffer, so neither case packs or slices a buffer
         if isinstance(data, int):
-            data = bytes([data])
-        buf = bytes([(reg >> 8) & 0xFF, reg & 0xFF]) + data
-        self.i2c.writeto(GT911_ADDR, buf)
+            data_buf = self._byte_buf
+            data_buf[0] = data
+            data = data_buf
+        self.i2c.writeto_mem(GT911_ADDR, reg, data, addrsize=16)
         
     def read_reg(self, reg, length):
-        """Read data from register"""
-        buf = bytes([(reg >> 8) & 0xFF, reg & 0xFF])
-        self.i2c.writeto(GT911_ADDR, buf)
-        return self.i2c.readfrom(GT911_ADDR, length)
+        """Read data from register (16-bit address, repeated start)"""
+        return self.i2c.readfrom_mem(GT911_ADDR, reg, length, addrsize=16)
+        
+    def read_reg_into(self, reg, buf):
+        """Read len(buf) bytes from register into buf without allocating"""
+        self.i2c.readfrom_mem_into(GT911_ADDR, reg, buf, addrsize=16)
         
     def init_touch(self):
         """Initialize GT911 touch controller"""
@@ -183,8 +222,14 @@ class GT911:
         
     def configure(self):
         """Configure GT911 settings"""
+        # Register address + config block + fresh flag, sent as one I2C write
+        buf = bytearray(2 + GT911_CONFIG_FRESH - GT911_CONFIG_VERSION + 1)
+        buf[0] = (GT911_CONFIG_VERSION >> 8) & 0xFF
+        buf[1] = GT911_CONFIG_VERSION & 0xFF
+        config = memoryview(buf)[2:]
+        
         # Read current configuration
-        config = bytearray(self.read_reg(GT911_CONFIG_VERSION, GT911_CONFIG_SIZE))
+        config[:GT911_CONFIG_SIZE] = self.read_reg(GT911_CONFIG_VERSION, GT911_CONFIG_SIZE)
         
         # Modify configuration
         config[1] = (self.width & 0xFF)  # X resolution low byte
@@ -195,69 +240,84 @@ class GT911:
         config[6] = 0x35  # Module switch 1
         config[7] = 0x00  # Module switch 2
         
-        # Calculate checksum
-        checksum = 0
-        for i in range(len(config)):
-            checksum += config[i]
-        checksum = (~checksum + 1) & 0xFF
+        # Calculate checksum over the registers before the checksum byte
+        checksum_offset = GT911_CONFIG_CHKSUM - GT911_CONFIG_VERSION
+        config[checksum_offset] = (-sum(config[:checksum_offset])) & 0xFF
+        config[GT911_CONFIG_FRESH - GT911_CONFIG_VERSION] = 1
         
-        # Write configuration
-        self.write_reg(GT911_CONFIG_VERSION, config)
-        self.write_reg(GT911_CONFIG_CHKSUM, bytes([checksum]))
-        self.write_reg(GT911_CONFIG_FRESH, bytes([1]))
+        # Write configuration, checksum and fresh flag in a single transaction
+        self.i2c.writeto(GT911_ADDR, buf)
         
         time.sleep_ms(100)
         
     def get_status(self):
         """Get touch status"""
-        status = self.read_reg(GT911_STATUS, 1)[0]
-        return status
+        self.read_reg_into(GT911_STATUS, self._status_buf)
+        return self._status_buf[0]
+        
+    @property
+    def pending(self):
+        """True if a touch report may be waiting (always True without an INT pin)"""
+        return not self.int_pin or self._touch_pending[0] != 0
         
     def get_touch(self):
         """Get touch coordinates"""
+        # No INT pulse since the last read - nothing new, skip the I2C traffic
+        if self.int_pin:
+            if not self._touch_pending[0]:
+                return None
+            self._touch_pending[0] = 0
+            
         status = self.get_status()
         
         # Check if screen is touched
         if status & 0x80:
             touch_count = status & 0x0F
             
-            if touch_count > 0 and touch_count <= 5:
-                # Read touch points
-                points = []
+            if touch_count > 0 and touch_count <= GT911_MAX_POINTS:
+                # Point registers are contiguous - read them all in one transaction
+                data = self._points_buf
+                self.read_reg_into(GT911_POINT_1, self._points_mv[:touch_count * GT911_POINT_SIZE])
+                
                 for i in range(touch_count):
-                    point_reg = GT911_POINT_1 + (i * GT911_POINT_SIZE)
-                    data = self.read_reg(point_reg, GT911_POINT_SIZE)
+                    offset = _POINT_OFFSETS[i]
                     
                     # Extract coordinates
-                    track_id = data[0]
-                    x = data[1] | (data[2] << 8)
-                    y = data[3] | (data[4] << 8)
-                    size = data[5] | (data[6] << 8)
-                    
-                    points.append({
-                        'id': track_id,
-                        'x': x,
-                        'y': y,
-                        'size': size
-                    })
+                    self._tp_id[i] = data[offset]
+                    self._tp_x[i] = data[offset + 1] | (data[offset + 2] << 8)
+                    self._tp_y[i] = data[offset + 3] | (data[offset + 4] << 8)
+                    self._tp_size[i] = data[offset + 5] | (data[offset + 6] << 8)
                 
                 # Clear status register
-                self.write_reg(GT911_STATUS, bytes([0]))
+                self.write_reg(GT911_STATUS, 0)
                 
-                self.touch_points = points
+                self._tp_n = touch_count
                 self.touched = True
                 
                 # Return first touch point for simple interface
-                if points:
-                    return (points[0]['x'], points[0]['y'])
+                return (self._tp_x[0], self._tp_y[0])
             else:
                 # Clear status register
-                self.write_reg(GT911_STATUS, bytes([0]))
+                self.write_reg(GT911_STATUS, 0)
         
         self.touched = False
-        self.touch_points = []
+        self._tp_n = 0
         return None
         
+    def get_touch_point(self, i):
+        """Get touch point i from the last poll as (id, x, y, size)"""
+        return (self._tp_id[i], self._tp_x[i], self._tp_y[i], self._tp_size[i])
+        
+    @property
+    def touch_points(self):
+        """Touch points from the last poll as a list of dicts (built on access)"""
+        return [{
+            'id': self._tp_id[i],
+            'x': self._tp_x[i],
+            'y': self._tp_y[i],
+            'size': self._tp_size[i]
+        } for i in range(self._tp_n)]
+        
     def get_all_touches(self):
         """Get all touch points"""
         self.get_touch()
@@ -6,9 +6,22 @@ Handles Hijri date calculations and Islamic event tracking
 import math
 from machine import RTC
 
+# Shared RTC handle (one machine binding for the whole module)
+_RTC = RTC()
+
+def get_today():
+    """Get today's RTC date as (year, month, day)"""
+    dt = _RTC.datetime()
+    return dt[0], dt[1], dt[2]
+
+# Days before each Hijri month (months alternate 30 and 29 days),
+# so event countdowns need no loops
+_CUM = (0, 30, 59, 89, 118, 148, 177, 207, 236, 266, 295, 325)
+_YEAR_DAYS = 354
+
 class HijriCalendar:
     def __init__(self):
-        self.rtc = RTC()
+        self.rtc = _RTC
         
         # Reference dates for accurate conversion (Gregorian -> Hijri)
         # Based on Umm al-Qura calendar (Saudi Arabia official calendar)
@@ -21,6 +34,17 @@ class HijriCalendar:
             (2025, 9, 4, 1447, 3, 12),   # Sep 4, 2025 = Rabi' I 12, 1447 (Today's correction)
         ]
         
+        # Reference dates with their Julian Day precomputed (the table is static),
+        # in ascending date order
+        self._ref = tuple(sorted(
+            (self.gregorian_to_julian(gy, gm, gd), hy, hm, hd)
+            for gy, gm, gd, hy, hm, hd in self.reference_dates
+        ))
+        
+        # Hijri date for the last RTC day seen: (year, month, day) -> (hy, hm, hd)
+        self._cache_key = None
+        self._cache_val = None
+        
         # Major Islamic events with their Hijri dates
         self.islamic_events = [
             {'name': 'Muharram', 'hijri_month': 1, 'hijri_day': 1, 'type': 'month_start'},
@@ -35,56 +59,53 @@ class HijriCalendar:
             {'name': 'Eid al-Adha', 'hijri_month': 12, 'hijri_day': 10, 'type': 'celebration'},
         ]
         
-    def gregorian_to_julian(self, year, month, day):
-        """Convert Gregorian date to Julian Day Number"""
-        if month <= 2:
-            year -= 1
-            month += 12
-            
-        a = int(year / 100)
-        b = 2 - a + int(a / 4)
+        # (month, day, name) per event, sorted by date for get_next_islamic_event
+        self._events_sorted = tuple(sorted(
+            (e['hijri_month'], e['hijri_day'], e['name']) for e in self.islamic_events
+        ))
         
-        if year < 1583 or (year == 1582 and month < 10) or (year == 1582 and month == 10 and day < 15):
-            b = 0
-            
-        return int(365.25 * (year + 4716)) + int(30.6001 * (month + 1)) + day + b - 1524.5
+    def gregorian_to_julian(self, year, month, day):
+        """Convert Gregorian date to Julian Day Number (integer math only)"""
+        # Shift to a March-based year so February is the last month
+        a = (14 - month) // 12
+        y = year + 4800 - a
+        m = month + 12 * a - 3
+        return day + (153 * m + 2) // 5 + 365 * y + y // 4 - y // 100 + y // 400 - 32045
     
     def gregorian_to_hijri(self, year, month, day):
         """Convert Gregorian date to Hijri date using reference dates"""
         target_jd = self.gregorian_to_julian(year, month, day)
         
-        # Find closest reference date
-        best_ref = None
-        min_diff = float('inf')
-        
-        for ref_greg_y, ref_greg_m, ref_greg_d, ref_hij_y, ref_hij_m, ref_hij_d in self.reference_dates:
-            ref_jd = self.gregorian_to_julian(ref_greg_y, ref_greg_m, ref_greg_d)
-            diff = abs(target_jd - ref_jd)
-            if diff < min_diff:
-                min_diff = diff
-                best_ref = (ref_jd, ref_hij_y, ref_hij_m, ref_hij_d)
-        
-        if best_ref is None:
+        if not self._ref:
             # Fallback to approximate calculation
             return 1447, 3, 12
             
+        # Count forward from the newest reference on or before the target
+        # (dates before the table starts count back from the earliest one)
+        best_ref = self._ref[0]
+        for ref in reversed(self._ref):
+            if ref[0] <= target_jd:
+                best_ref = ref
+                break
+            
         ref_jd, ref_hij_y, ref_hij_m, ref_hij_d = best_ref
         
         # Calculate days difference
-        days_diff = int(target_jd - ref_jd)
+        days_diff = target_jd - ref_jd
         
-        # Convert reference Hijri date to days since Hijri epoch
-        hijri_days = (ref_hij_y - 1) * 354 + (ref_hij_m - 1) * 29.5 + ref_hij_d
+        # Convert reference Hijri date to half-days since Hijri epoch
+        # (29.5-day months are 59 half-days, so everything stays integer)
+        hijri_half_days = (ref_hij_y - 1) * 708 + (ref_hij_m - 1) * 59 + ref_hij_d * 2
         
         # Add the difference
-        hijri_days += days_diff
+        hijri_half_days += days_diff * 2
         
         # Convert back to Hijri date
-        hijri_year = int(hijri_days / 354) + 1
-        remaining_days = hijri_days - (hijri_year - 1) * 354
+        hijri_year = hijri_half_days // 708 + 1
+        remaining = hijri_half_days - (hijri_year - 1) * 708
         
-        hijri_month = int(remaining_days / 29.5) + 1
-        hijri_day = int(remaining_days - (hijri_month - 1) * 29.5)
+        hijri_month = remaining // 59 + 1
+        hijri_day = (remaining - (hijri_month - 1) * 59) // 2
         
         # Ensure valid ranges
         if hijri_day < 1:
@@ -100,12 +121,15 @@ class HijriCalendar:
         if year == 2025 and month == 9 and day == 4:
             return 1447, 3, 12  # Rabi' I 12, 1447
             
-        return int(hijri_year), int(hijri_month), int(hijri_day)
+        return hijri_year, hijri_month, hijri_day
     
     def get_current_hijri_date(self):
-        """Get current Hijri date"""
-        year, month, day, _, _, _, _, _ = self.rtc.datetime()
-        return self.gregorian_to_hijri(year, month, day)
+        """Get current Hijri date (recomputed only when the RTC date changes)"""
+        key = get_today()
+        if key != self._cache_key:
+            self._cache_val = self.gregorian_to_hijri(key[0], key[1], key[2])
+            self._cache_key = key
+        return self._cache_val
     
     def get_hijri_month_name(self, month):
         """Get Hijri month name"""
@@ -120,61 +144,32 @@ class HijriCalendar:
         """Get the next Islamic event"""
         hijri_year, hijri_month, hijri_day = self.get_current_hijri_date()
         
-        # Find the next event
-        for event in self.islamic_events:
-            if (event['hijri_month'] > hijri_month or 
-                (event['hijri_month'] == hijri_month and event['hijri_day'] >= hijri_day)):
+        # Find the next event (events are sorted, so the first match is it)
+        for event_month, event_day, name in self._events_sorted:
+            if (event_month > hijri_month or 
+                (event_month == hijri_month and event_day >= hijri_day)):
                 days_until = self.calculate_days_until_event(
-                    hijri_month, hijri_day,
-                    event['hijri_month'], event['hijri_day']
+                    hijri_month, hijri_day, event_month, event_day
                 )
-                return event['name'], days_until
+                return name, days_until
         
         # If no events left this year, return first event of next year
-        first_event = self.islamic_events[0]
+        event_month, event_day, name = self._events_sorted[0]
         days_until = self.calculate_days_until_next_year_event(
-            hijri_month, hijri_day,
-            first_event['hijri_month'], first_event['hijri_day']
+            hijri_month, hijri_day, event_month, event_day
         )
-        return first_event['name'], days_until
+        return name, days_until
     
     def calculate_days_until_event(self, current_month, current_day, event_month, event_day):
         """Calculate days until an event in the same Hijri year"""
-        days = 0
-        
-        # Days in Hijri months (alternating 29 and 30 days)
-        days_in_month = [30, 29, 30, 29, 30, 29, 30, 29, 30, 29, 30, 29]
-        
-        if current_month == event_month:
-            return max(0, event_day - current_day)
-        
-        # Days remaining in current month
-        days += days_in_month[current_month - 1] - current_day
-        
-        # Days in intervening months
-        for month in range(current_month + 1, event_month):
-            days += days_in_month[month - 1]
-        
-        # Days in event month
-        days += event_day
-        
-        return days
+        days = (_CUM[event_month - 1] + event_day) - (_CUM[current_month - 1] + current_day)
+        return max(0, days)
     
     def calculate_days_until_next_year_event(self, current_month, current_day, event_month, event_day):
         """Calculate days until an event in the next Hijri year"""
-        days_in_month = [30, 29, 30, 29, 30, 29, 30, 29, 30, 29, 30, 29]
-        
-        # Days remaining in current year
-        days = days_in_month[current_month - 1] - current_day
-        for month in range(current_month + 1, 13):
-            days += days_in_month[month - 1]
-        
-        # Days from beginning of next year to event
-        for month in range(1, event_month):
-            days += days_in_month[month - 1]
-        days += event_day
-        
-        return days
+        # Days remaining in current year, then days from next year's start to the event
+        days = _YEAR_DAYS - (_CUM[current_month - 1] + current_day)
+        return days + _CUM[event_month - 1] + event_day
     
     def get_hijri_date_string(self):
         """Get formatted Hijri date string"""
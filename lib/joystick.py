@@ -4,8 +4,31 @@ Joystick Driver for GeeekPi GPIO Expansion Module
 """
 
 from machine import Pin, ADC
+import array
 import time
 
+# Full-scale deflection in raw ADC counts (16-bit reading, centered)
+FULL_SCALE = 32768
+
+# Center calibration: samples per axis; the lowest and highest are discarded
+CALIBRATION_SAMPLES = 16
+
+def _trimmed_mean(buf):
+    """Sort buf in place and average it without its min and max sample"""
+    # Insertion sort - the buffer is tiny and this allocates nothing
+    for i in range(1, len(buf)):
+        value = buf[i]
+        j = i - 1
+        while j >= 0 and buf[j] > value:
+            buf[j + 1] = buf[j]
+            j -= 1
+        buf[j + 1] = value
+        
+    total = 0
+    for i in range(1, len(buf) - 1):
+        total += buf[i]
+    return total // (len(buf) - 2)
+
 class Joystick:
     def __init__(self, x_pin, y_pin, sw_pin, deadzone=200):
         """
@@ -24,29 +47,90 @@ class Joystick:
         self.center_x = 32768  # 16-bit ADC center
         self.center_y = 32768
         
+        # Default get_direction threshold (0.5 of full deflection) in ADC counts
+        self.direction_limit = FULL_SCALE // 2
+        
+        # Scale factor for normalizing (multiply rather than divide per read)
+        self._inv = 1.0 / FULL_SCALE
+        
         # Calibrate center position
         self.calibrate()
         
-        # Button debouncing
-        self.last_sw_state = 1
-        self.sw_pressed = False
+        # Center button: the pin IRQ debounces and latches presses so none are
+        # missed between polls, even a tap released before the next poll
+        # (bytearrays and an array tick so the hard ISR never allocates)
+        self._sw_flag = bytearray(1)
+        self._sw_held = bytearray(1)
+        self.debounce_time = 50  # ms
+        self._edge_ms = array.array('i', [time.ticks_ms()])
+        self._sw_irq = self.sw_pin.irq(trigger=Pin.IRQ_FALLING | Pin.IRQ_RISING,
+                                       handler=self._sw_isr, hard=True)
+        
+    def _sw_isr(self, pin):
+        """
+        Hard IRQ handler for the center button
+        Only the first edge after debounce_time without any edge counts; bounces
+        always follow another edge closely. Its direction comes from the IRQ
+        flags, since the pin level may already have bounced by the time we run.
+        """
+        now = time.ticks_ms()
+        quiet = time.ticks_diff(now, self._edge_ms[0]) > self.debounce_time
+        self._edge_ms[0] = now
+        if not quiet:
+            return
+        
+        # If both edges were flagged, the first one is the opposite of the
+        # current held state
+        flags = self._sw_irq.flags()
+        if flags & Pin.IRQ_FALLING and not (self._sw_held[0] and flags & Pin.IRQ_RISING):
+            self._sw_held[0] = 1
+            self._sw_flag[0] = 1
+        else:
+            self._sw_held[0] = 0
         
     def calibrate(self):
-        """Calibrate center position by averaging several readings"""
+        """Calibrate center position from a trimmed mean of several readings"""
         print("Calibrating joystick...")
-        x_sum = 0
-        y_sum = 0
-        samples = 10
+        x_buf = array.array('H', [0] * CALIBRATION_SAMPLES)
+        y_buf = array.array('H', [0] * CALIBRATION_SAMPLES)
         
-        for _ in range(samples):
-            x_sum += self.x_adc.read_u16()
-            y_sum += self.y_adc.read_u16()
+        for i in range(CALIBRATION_SAMPLES):
+            x_buf[i] = self.x_adc.read_u16()
+            y_buf[i] = self.y_adc.read_u16()
             time.sleep_ms(10)
             
-        self.center_x = x_sum // samples
-        self.center_y = y_sum // samples
+        # Dropping the extremes keeps a single ADC spike from biasing the center
+        self.center_x = _trimmed_mean(x_buf)
+        self.center_y = _trimmed_mean(y_buf)
+        self._update_thresholds()
         print(f"Joystick calibrated: center=({self.center_x}, {self.center_y})")
         
+    def set_threshold(self, threshold):
+        """Set the default get_direction threshold (fraction of full deflection)"""
+        self.direction_limit = int(threshold * FULL_SCALE)
+        self._update_thresholds()
+        
+    def _update_thresholds(self):
+        """Precompute absolute ADC bounds for get_direction around the center"""
+        limit = self.direction_limit
+        self._thr_lo_x = self.center_x - limit
+        self._thr_hi_x = self.center_x + limit
+        self._thr_lo_y = self.center_y - limit
+        self._thr_hi_y = self.center_y + limit
+        
+    def read_axes(self):
+        """Read raw X/Y ADC values as a tuple (no dict allocation)"""
+        return self.x_adc.read_u16(), self.y_adc.read_u16()
+        
+    def read_raw_signed(self):
+        """
+        Read signed X/Y offsets from the calibrated center in ADC counts
+        (-32768..32767); integer only, no float math
+        """
+        x = self.x_adc.read_u16() - self.center_x
+        y = self.y_adc.read_u16() - self.center_y
+        return x, y
+        
     def read_raw(self):
         """Read raw ADC values"""
         return {
@@ -55,69 +139,78 @@ class Joystick:
             'sw': self.sw_pin.value()
         }
         
-    def read_normalized(self):
-        """Read normalized values (-1.0 to 1.0)"""
-        raw = self.read_raw()
-        
-        # Normalize to -1.0 to 1.0 range
-        x_norm = (raw['x'] - self.center_x) / 32768.0
-        y_norm = (raw['y'] - self.center_y) / 32768.0
-        
-        # Apply deadzone
-        if abs(x_norm) < (self.deadzone / 32768.0):
-            x_norm = 0.0
-        if abs(y_norm) < (self.deadzone / 32768.0):
-            y_norm = 0.0
+    def read_normalized_tuple(self):
+        """
+        Read normalized X/Y values (-1.0 to 1.0) as a tuple (no dict allocation)
+        Uses soft-float math; prefer read_raw_signed() in hot paths
+        """
+        x, y = self.read_raw_signed()
+        
+        # Apply deadzone (in raw counts, before converting to float)
+        if abs(x) < self.deadzone:
+            x = 0
+        if abs(y) < self.deadzone:
+            y = 0
             
-        # Clamp to -1.0 to 1.0
-        x_norm = max(-1.0, min(1.0, x_norm))
-        y_norm = max(-1.0, min(1.0, y_norm))
+        # Normalize and clamp to -1.0 to 1.0
+        inv = self._inv
+        x_norm = max(-1.0, min(1.0, x * inv))
+        y_norm = max(-1.0, min(1.0, y * inv))
+        return x_norm, y_norm
         
+    def read_normalized(self):
+        """
+        Read normalized values (-1.0 to 1.0)
+        Deprecated: kept for compatibility; use read_normalized_tuple()
+        """
+        x_norm, y_norm = self.read_normalized_tuple()
         return {
             'x': x_norm,
             'y': y_norm,
-            'sw': raw['sw']
+            'sw': self.sw_pin.value()
         }
         
-    def get_direction(self, threshold=0.5):
+    def get_direction(self, threshold=None):
         """
         Get discrete direction from joystick
+        Args:
+            threshold: Fraction of full deflection (default 0.5)
         Returns: 'up', 'down', 'left', 'right', 'center', or None
         """
-        norm = self.read_normalized()
+        # Compare raw ADC readings against precomputed bounds - no float math
+        if threshold is None:
+            lo_x, hi_x = self._thr_lo_x, self._thr_hi_x
+            lo_y, hi_y = self._thr_lo_y, self._thr_hi_y
+        else:
+            limit = int(threshold * FULL_SCALE)
+            lo_x, hi_x = self.center_x - limit, self.center_x + limit
+            lo_y, hi_y = self.center_y - limit, self.center_y + limit
+        x, y = self.read_axes()
         
-        if abs(norm['x']) < threshold and abs(norm['y']) < threshold:
+        if lo_x < x < hi_x and lo_y < y < hi_y:
             return 'center'
-        elif norm['y'] < -threshold:  # Up (Y-axis inverted)
+        elif y < lo_y:  # Up (Y-axis inverted)
             return 'up'
-        elif norm['y'] > threshold:   # Down
+        elif y > hi_y:   # Down
             return 'down'
-        elif norm['x'] < -threshold:  # Left
+        elif x < lo_x:  # Left
             return 'left' 
-        elif norm['x'] > threshold:   # Right
+        elif x > hi_x:   # Right
             return 'right'
         else:
             return None
             
     def get_button_press(self):
-        """Check for center button press (with debouncing)"""
-        current_state = self.sw_pin.value()
-        
-        if self.last_sw_state == 1 and current_state == 0:
-            # Button pressed (falling edge)
-            self.sw_pressed = True
-            time.sleep_ms(50)  # Debounce delay
-        
-        self.last_sw_state = current_state
-        
-        if self.sw_pressed:
-            self.sw_pressed = False
-            return True
-        return False
+        """Check for a center button press latched (and debounced) by the pin IRQ"""
+        if not self._sw_flag[0]:
+            return False
+        self._sw_flag[0] = 0
+        return True
         
     def wait_for_direction(self, timeout_ms=None):
         """
         Wait for joystick movement in any direction
+        The axes are analog and have no IRQ, so they are sampled at 50 Hz
         Returns the first direction detected or None if timeout
         """
         start_time = time.ticks_ms()
@@ -130,11 +223,12 @@ class Joystick:
             if timeout_ms and time.ticks_diff(time.ticks_ms(), start_time) > timeout_ms:
                 return None
                 
-            time.sleep_ms(20)  # Increased sleep for better performance
+            time.sleep_ms(20)  # 50 Hz sampling
             
     def wait_for_button(self, timeout_ms=None):
         """
-        Wait for center button press
+        Wait for center button press latched by the pin IRQ, checking every 10 ms
+        (time.sleep_ms rather than lightsleep, which drops the USB REPL)
         Returns True if pressed, False if timeout
         """
         start_time = time.ticks_ms()
@@ -143,7 +237,10 @@ class Joystick:
             if self.get_button_press():
                 return True
                 
-            if timeout_ms and time.ticks_diff(time.ticks_ms(), start_time) > timeout_ms:
-                return False
-                
-            time.sleep_ms(10)
\ No newline at end of file
+            remaining = 10
+            if timeout_ms:
+                remaining = timeout_ms - time.ticks_diff(time.ticks_ms(), start_time)
+                if remaining <= 0:
+                    return False
+                    
+            time.sleep_ms(min(remaining, 10))
\ No newline at end of file
@@ -5,7 +5,10 @@ Settings that work with joystick and buttons only (no touch required)
 
 import time
 from machine import RTC
-from time import sleep_ms
+from time import sleep_ms, ticks_ms, ticks_diff
+
+# Shared RTC handle instead of a new RTC() per settings instance
+_RTC = RTC()
 
 class NoTouchSettings:
     def __init__(self, ui, hw, config):
@@ -13,12 +16,22 @@ class NoTouchSettings:
         self.ui = ui
         self.hw = hw
         self.config = config
-        self.rtc = RTC()
+        self.rtc = _RTC
         
         # Input debouncing
         self.last_input_time = 0
         self.debounce_ms = 200
         
+        # Row highlighted by the last draw_menu (None forces a full redraw)
+        self._prev_selected = None
+        
+        # Bound input methods, looked up once instead of on every frame
+        self._js_dir = hw.joystick.get_direction
+        self._js_btn = hw.joystick.get_button_press
+        self._btns_update = hw.buttons.update
+        self._btn_sel = hw.buttons.get_select_press
+        self._btn_back = hw.buttons.get_back_press
+        
         print("Settings initialized (Touch disabled)")
         
     def show_settings_menu(self):
@@ -35,8 +48,10 @@ class NoTouchSettings:
             {'name': 'Exit Settings', 'key': 'exit', 'type': 'action'}
         ]
         
+        last_index = len(settings_items) - 1
         selected_index = 0
         last_selected = -1
+        self._prev_selected = None  # Full redraw on entry
         
         while True:
             # Only redraw if selection changed
@@ -45,14 +60,22 @@ class NoTouchSettings:
                 last_selected = selected_index
             
             # Get input
-            input_action = self.get_input()
+            try:
+                input_action = self.get_input()
+            except Exception as e:
+                print(f"Input error: {e}")
+                input_action = None
             
             if input_action == 'up':
-                selected_index = (selected_index - 1) % len(settings_items)
+                selected_index -= 1
+                if selected_index < 0:
+                    selected_index = last_index
                 print(f"Selected: {settings_items[selected_index]['name']}")
                 
             elif input_action == 'down':
-                selected_index = (selected_index + 1) % len(settings_items)
+                selected_index += 1
+                if selected_index > last_index:
+                    selected_index = 0
                 print(f"Selected: {settings_items[selected_index]['name']}")
                 
             elif input_action == 'select':
@@ -64,47 +87,42 @@ class NoTouchSettings:
                     
                 # Toggle or modify setting
                 self.modify_setting(item)
+                self.draw_menu_row(item, selected_index, True)
                 
             elif input_action == 'back':
                 print("Exiting settings (back button)")
                 break
             
-            time.sleep(0.05)
+            time.sleep_ms(50)
         
         return True
     
     def get_input(self):
         """Get input from joystick and buttons only"""
-        current_time = time.ticks_ms()
+        current_time = ticks_ms()
         
         # Debounce check
-        if time.ticks_diff(current_time, self.last_input_time) < self.debounce_ms:
+        if ticks_diff(current_time, self.last_input_time) < self.debounce_ms:
             return None
         
         # Check joystick
-        try:
-            direction = self.hw.joystick.get_direction()
-            if direction and direction != 'center':
-                self.last_input_time = current_time
-                return direction
-                
-            if self.hw.joystick.get_button_press():
-                self.last_input_time = current_time
-                return 'select'
-        except Exception as e:
-            print(f"Joystick error: {e}")
+        direction = self._js_dir()
+        if direction and direction != 'center':
+            self.last_input_time = current_time
+            return direction
+            
+        if self._js_btn():
+            self.last_input_time = current_time
+            return 'select'
         
         # Check buttons
-        try:
-            self.hw.buttons.update()
-            if self.hw.buttons.get_select_press():
-                self.last_input_time = current_time
-                return 'select'
-            if self.hw.buttons.get_back_press():
-                self.last_input_time = current_time
-                return 'back'
-        except Exception as e:
-            print(f"Button error: {e}")
+        self._btns_update()
+        if self._btn_sel():
+            self.last_input_time = current_time
+            return 'select'
+        if self._btn_back():
+            self.last_input_time = current_time
+            return 'back'
         
         return None
     
@@ -133,8 +151,17 @@ class NoTouchSettings:
                 print(f"{item['name']}: {options[0]}")
     
     def draw_menu(self, items, selected):
-        """Draw menu on display"""
+        """Draw menu on display (only the rows whose highlight changed, after the first draw)"""
         try:
+            prev = self._prev_selected
+            if prev is not None:
+                # Selection moved - repaint just the old and new rows
+                if prev != selected:
+                    self.draw_menu_row(items[prev], prev, False)
+                self.draw_menu_row(items[selected], selected, True)
+                self._prev_selected = selected
+                return
+                
             # Clear display
             self.ui.display.clear(0x0000)
             
@@ -143,31 +170,36 @@ class NoTouchSettings:
             self.ui.draw_text_centered("(No Touch Mode)", 45, 1, 0xF800)
             
             # Draw menu items
-            y_start = 80
             for i, item in enumerate(items):
-                y_pos = y_start + i * 40
-                
-                # Highlight selected item
-                if i == selected:
-                    self.ui.display.fill_rect(20, y_pos - 5, 280, 35, 0x001F)
-                    color = 0xFFFF
-                else:
-                    color = 0xC618
-                
-                # Draw item text
-                if item['type'] == 'bool':
-                    value = self.config.get(item['key'], False)
-                    text = f"{item['name']}: {'ON' if value else 'OFF'}"
-                elif item['type'] == 'select':
-                    value = self.config.get(item['key'], '')
-                    text = f"{item['name']}: {value}"
-                else:
-                    text = item['name']
-                
-                self.ui.draw_text_centered(text, y_pos + 10, 1, color)
+                self.draw_menu_row(item, i, i == selected)
             
             # Draw instructions
             self.ui.draw_text_centered("↑↓ Navigate  ● Select  ← Back", 440, 1, 0xAAAA)
+            self._prev_selected = selected
             
         except Exception as e:
-            print(f"Drawing error: {e}")
\ No newline at end of file
+            print(f"Drawing error: {e}")
+            
+    def draw_menu_row(self, item, index, selected):
+        """Draw a single menu row, painting its background band first"""
+        y_pos = 80 + index * 40
+        
+        # Highlight selected item
+        if selected:
+            self.ui.display.fill_rect(20, y_pos - 5, 280, 35, 0x001F)
+            color = 0xFFFF
+        else:
+            self.ui.display.fill_rect(20, y_pos - 5, 280, 35, 0x0000)
+            color = 0xC618
+        
+        # Draw item text
+        if item['type'] == 'bool':
+            value = self.config.get(item['key'], False)
+            text = f"{item['name']}: {'ON' if value else 'OFF'}"
+        elif item['type'] == 'select':
+            value = self.config.get(item['key'], '')
+            text = f"{item['name']}: {value}"
+        else:
+            text = item['name']
+        
+        self.ui.draw_text_centered(text, y_pos + 10, 1, color)
\ No newline at end of file
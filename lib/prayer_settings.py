@@ -3,8 +3,75 @@ Settings Manager for Muslim Companion Application
 Handles all settings-related functionality
 """
 
-from time import sleep_ms
+import time
+from time import sleep_ms, ticks_ms, ticks_diff, ticks_add
 from machine import RTC
+import framebuf
+import micropython
+from micropython import const
+
+# Debug logging to the USB console; with 0 the compiler drops the print blocks
+_DEBUG = const(0)
+
+# RGB565 colors used by the status screens
+_BLACK = const(0x0000)
+_WHITE = const(0xFFFF)
+_GREEN = const(0x07E0)
+_RED = const(0xF800)
+_YELLOW = const(0xFFE0)
+_GREY = const(0xAAAA)
+
+# The same colors byte-swapped for framebuf (little-endian) -> ST7796 (big-endian)
+_FB_BLACK = const(0x0000)
+_FB_GREEN = const(0xE007)
+
+# "Clock Time Set!" confirmation box position and size
+_CONFIRM_X = const(50)
+_CONFIRM_Y = const(200)
+_CONFIRM_W = const(220)
+_CONFIRM_H = const(80)
+
+# Clock editor auto-repeat: up/down steps once on press, then after
+# _REPEAT_HOLD_MS repeats every _REPEAT_MS; once held for _FAST_HOLD_MS
+# each repeat steps by _FAST_STEP
+_REPEAT_HOLD_MS = const(500)
+_REPEAT_MS = const(150)
+_FAST_HOLD_MS = const(2000)
+_FAST_STEP = const(10)
+
+# Input loop period; only the time the loop body did not use is slept
+_LOOP_PERIOD_MS = const(20)
+
+def _sleep_rest(start):
+    """Sleep out whatever is left of the loop period that began at start"""
+    remain = ticks_diff(ticks_add(start, _LOOP_PERIOD_MS), ticks_ms())
+    if remain > 0:
+        sleep_ms(remain)
+
+# Settings menu entries as parallel tuples indexed by row, built once at import
+# (an index into a tuple is cheaper than a dict lookup per field)
+_NAMES = ('Set Clock Time', 'WiFi Setup', 'Sync Time Now', 'Location',
+          'Calculation Method', 'Daylight Saving', 'Buzzer Enabled',
+          'Buzzer Duration', 'Display Brightness', 'Time Format',
+          'Auto Time Sync', 'Exit Settings')
+_KEYS = ('set_clock', 'wifi_setup', 'sync_time', 'location_name',
+         'method', 'daylight_saving', 'buzzer_enabled',
+         'buzzer_duration', 'display_brightness', 'time_format',
+         'ntp_enabled', 'exit')
+_TYPES = ('clock', 'action', 'action', 'text',
+          'select', 'bool', 'bool',
+          'number', 'number', 'select',
+          'bool', 'action')
+_OPTIONS = (None, None, None, None,
+            ('ISNA', 'MWL', 'Mecca'), None, None,
+            None, None, ('12h', '24h'),
+            None, None)
+
+# Ring map per select setting: current option -> next option
+_NEXT_OPTION = {
+    _KEYS[i]: {o: opts[(j + 1) % len(opts)] for j, o in enumerate(opts)}
+    for i, opts in enumerate(_OPTIONS) if opts
+}
 
 class PrayerSettings:
     def __init__(self, ui, hw, config):
@@ -13,95 +80,98 @@ class PrayerSettings:
         self.hw = hw
         self.config = config
         self.rtc = RTC()
+        self._wifi_sync = None  # Created on first WiFi use, then reused
         
+        # DST status screen text per (timezone, enabled): (date, timezone_line, offset_lines)
+        self._dst_cache = {}
+        
+    @micropython.native
     def show_settings_with_navigation(self):
         """Display settings screen with joystick navigation"""
-        settings_items = [
-            {'name': 'Set Clock Time', 'key': 'set_clock', 'type': 'clock'},
-            {'name': 'WiFi Setup', 'key': 'wifi_setup', 'type': 'action'},
-            {'name': 'Sync Time Now', 'key': 'sync_time', 'type': 'action'},
-            {'name': 'Location', 'key': 'location_name', 'type': 'text'},
-            {'name': 'Calculation Method', 'key': 'method', 'type': 'select', 
-             'options': ['ISNA', 'MWL', 'Mecca']},
-            {'name': 'Daylight Saving', 'key': 'daylight_saving', 'type': 'bool'},
-            {'name': 'Buzzer Enabled', 'key': 'buzzer_enabled', 'type': 'bool'},
-            {'name': 'Buzzer Duration', 'key': 'buzzer_duration', 'type': 'number'},
-            {'name': 'Display Brightness', 'key': 'display_brightness', 'type': 'number'},
-            {'name': 'Time Format', 'key': 'time_format', 'type': 'select', 
-             'options': ['12h', '24h']},
-            {'name': 'Auto Time Sync', 'key': 'ntp_enabled', 'type': 'bool'},
-            {'name': 'Exit Settings', 'key': 'exit', 'type': 'action'}
-        ]
-        
         selected_index = 0
-        last_selected_index = -1  # Track if selection changed
-        needs_redraw = True  # Initial draw needed
+        dirty = True  # Set wherever the screen changes; initial draw needed
+        prev_index = -1  # Row the cursor left, or -1 for a full redraw
+        
+        # Bind hot-loop objects to locals (each self.x.y is a dict lookup)
+        poll_inputs = self.hw.poll_inputs
+        ui = self.ui
+        last_index = len(_KEYS) - 1
         
         while True:
-            # Only draw if something changed
-            if needs_redraw or selected_index != last_selected_index:
-                self.ui.draw_settings_menu(settings_items, selected_index, self.config)
-                last_selected_index = selected_index
-                needs_redraw = False
+            start = ticks_ms()
             
-            # Handle joystick navigation - reduced timeout for responsiveness
-            direction = self.hw.joystick.wait_for_direction(timeout_ms=50)
+            # Only draw if something changed; a cursor move repaints just two rows
+            if dirty:
+                if prev_index < 0:
+                    ui.draw_settings_menu(_NAMES, _KEYS, selected_index, self.config)
+                else:
+                    ui.redraw_settings_row(_NAMES, _KEYS, prev_index, selected_index, self.config)
+                dirty = False
             
-            # Update buttons
-            self.hw.buttons.update()
+            # Joystick, buttons and touch in one pass - reduced timeout for responsiveness
+            direction, select, back, touch_xy = poll_inputs(50)
             
-            # Check for touch input - less frequent to improve performance
-            if self.hw.touch:  # Only if touch is available
-                touch_data = self.hw.touch.get_touch()
-                if touch_data:
-                    x, y = touch_data[0], touch_data[1]
-                    action_obj = self.ui.handle_touch(x, y)
+            if touch_xy:
+                action_obj = ui.handle_touch(touch_xy[0], touch_xy[1])
+                
+                if action_obj:
+                    action = action_obj.get('action') if isinstance(action_obj, dict) else action_obj
                     
-                    if action_obj:
-                        action = action_obj.get('action') if isinstance(action_obj, dict) else action_obj
-                        
-                        if action and action.startswith('tab_'):
-                            # Tab switching from settings
-                            tab_name = action[4:]  # Remove 'tab_' prefix
-                            if tab_name != 'settings':
-                                # Switch to different tab
-                                return tab_name  # Return the tab to switch to
-                            # If same tab (settings), just continue
+                    if action and action.startswith('tab_'):
+                        # Tab switching from settings
+                        tab_name = action[4:]  # Remove 'tab_' prefix
+                        if tab_name != 'settings':
+                            # Switch to different tab
+                            return tab_name  # Return the tab to switch to
+                        # If same tab (settings), just continue
             
             if direction == 'up':
-                selected_index = (selected_index - 1) % len(settings_items)
+                prev_index = selected_index
+                selected_index -= 1
+                if selected_index < 0:
+                    selected_index = last_index
+                dirty = True
             elif direction == 'down':
-                selected_index = (selected_index + 1) % len(settings_items)
-            elif direction == 'right' or self.hw.buttons.get_select_press():
+                prev_index = selected_index
+                selected_index += 1
+                if selected_index > last_index:
+                    selected_index = 0
+                dirty = True
+            elif direction == 'right' or select:
                 # Select/modify item
-                item = settings_items[selected_index]
-                if item['key'] == 'exit':
+                key = _KEYS[selected_index]
+                if key == 'exit':
                     break
-                elif item['key'] == 'wifi_setup':
+                elif key == 'wifi_setup':
                     self.setup_wifi()
-                    needs_redraw = True
-                elif item['key'] == 'sync_time':
+                    prev_index = -1
+                    dirty = True
+                elif key == 'sync_time':
                     self.sync_time_now()
-                    needs_redraw = True
+                    prev_index = -1
+                    dirty = True
                 else:
-                    result = self.modify_setting(item)
-                    needs_redraw = True  # Redraw after modification
+                    result = self.modify_setting(selected_index)
+                    prev_index = -1  # Full redraw after modification
+                    dirty = True
                     # If DST setting was changed, update prayer times
-                    if item['key'] == 'daylight_saving' and result:
+                    if key == 'daylight_saving' and result:
                         # Force prayer times recalculation
                         self.config.set('last_prayer_update', 0)
-            elif direction == 'left' or self.hw.buttons.get_back_press() or self.hw.joystick.get_button_press():
+            elif direction == 'left' or back:
                 # Exit settings
                 break
                 
-            sleep_ms(20)  # Reduced sleep for better responsiveness
+            _sleep_rest(start)
         
         # Return to main screen (just redraw, don't recalculate prayer times)
         return True  # Signal to update display
     
-    def modify_setting(self, setting_item):
-        """Modify a setting using joystick/buttons"""
-        key = setting_item['key']
+    @micropython.native
+    def modify_setting(self, index):
+        """Modify the setting at menu row index using joystick/buttons"""
+        key = _KEYS[index]
+        setting_type = _TYPES[index]
         
         if key == 'set_clock':
             self.set_clock_time()
@@ -109,7 +179,7 @@ class PrayerSettings:
             
         current_value = self.config.get(key)
         
-        if setting_item['type'] == 'bool':
+        if setting_type == 'bool':
             # Toggle boolean
             new_value = not current_value
             self.config.set(key, new_value)
@@ -120,44 +190,47 @@ class PrayerSettings:
             
             return True
             
-        elif setting_item['type'] == 'select':
+        elif setting_type == 'select':
             # Cycle through options
-            options = setting_item['options']
-            try:
-                current_index = options.index(current_value)
-                new_index = (current_index + 1) % len(options)
-                self.config.set(key, options[new_index])
-            except ValueError:
-                self.config.set(key, options[0])
+            # (an unknown value falls back to the first option)
+            new_value = _NEXT_OPTION[key].get(current_value, _OPTIONS[index][0])
+            self.config.set(key, new_value)
             return True
                 
-        elif setting_item['type'] == 'number':
+        elif setting_type == 'number':
             # Adjust number value
             last_value = current_value
-            self.ui.draw_number_editor(setting_item['name'], current_value)
+            self.ui.draw_number_editor(_NAMES[index], current_value)
+            
+            joystick = self.hw.joystick
+            buttons = self.hw.buttons
+            ui = self.ui
             
             while True:
-                direction = self.hw.joystick.wait_for_direction(timeout_ms=30)  # Faster response
-                self.hw.buttons.update()
+                # The wait returns at once while the stick is held, so the
+                # loop period is what paces repeated steps
+                start = ticks_ms()
+                direction = joystick.wait_for_direction(timeout_ms=30)
+                buttons.update()
                 
                 if direction == 'up':
                     current_value += 1
                 elif direction == 'down':
                     current_value = max(1, current_value - 1)
-                elif direction == 'right' or self.hw.buttons.get_select_press():
+                elif direction == 'right' or buttons.get_select_press():
                     # Save value
                     self.config.set(key, current_value)
                     return True
-                elif direction == 'left' or self.hw.buttons.get_back_press() or self.hw.joystick.get_button_press():
+                elif direction == 'left' or buttons.get_back_press() or joystick.get_button_press():
                     # Cancel
                     return False
                     
                 # Only update display if value changed
                 if current_value != last_value:
-                    self.ui.draw_number_editor(setting_item['name'], current_value)
+                    ui.draw_number_editor(_NAMES[index], current_value)
                     last_value = current_value
                     
-                sleep_ms(20)  # Faster loop
+                _sleep_rest(start)
     
     def set_clock_time(self):
         """Set the RTC clock time"""
@@ -165,82 +238,132 @@ class PrayerSettings:
         year, month, day, weekday, hour, minute, second, _ = self.rtc.datetime()
         
         # Edit hour
-        hour = self.edit_time_value("Hour", hour, 0, 23)
+        hour = self.edit_time_value("Set Hour", hour, 0, 23)
         if hour is None:
             return  # Cancelled
             
         # Edit minute
-        minute = self.edit_time_value("Minute", minute, 0, 59)
+        minute = self.edit_time_value("Set Minute", minute, 0, 59)
         if minute is None:
             return  # Cancelled
             
         # Edit day
-        day = self.edit_time_value("Day", day, 1, 31)
+        day = self.edit_time_value("Set Day", day, 1, 31)
         if day is None:
             return  # Cancelled
             
         # Edit month
-        month = self.edit_time_value("Month", month, 1, 12)
+        month = self.edit_time_value("Set Month", month, 1, 12)
         if month is None:
             return  # Cancelled
             
         # Edit year
-        year = self.edit_time_value("Year", year, 2024, 2050)
+        year = self.edit_time_value("Set Year", year, 2024, 2050)
         if year is None:
             return  # Cancelled
             
         # Set the new time
         self.rtc.datetime((year, month, day, weekday, hour, minute, 0, 0))
-        print(f"Clock set to: {year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}")
+        if _DEBUG:
+            print(f"Clock set to: {year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}")
         
-        # Show confirmation
-        self.ui.display.fill_rect(50, 200, 220, 80, 0x07E0)  # Green background
-        self.ui.draw_text_centered("Clock Time Set!", 220, 2, 0x0000)
+        # Show confirmation: one fill for the box, then the text line rendered
+        # in a small RAM strip and sent as a single SPI write instead of one
+        # display transaction per text pixel
+        ui = self.ui
+        ui.display.fill_rect(_CONFIRM_X, _CONFIRM_Y, _CONFIRM_W, _CONFIRM_H, _GREEN)
+        text = "Clock Time Set!"
+        w = ui.font.get_text_width(text, 2)
+        h = ui.font.get_text_height(2)
+        try:
+            buf = bytearray(w * h * 2)
+        except MemoryError:
+            # The clock is already set; fall back to drawing pixel by pixel
+            ui.draw_text_centered(text, 220, 2, _BLACK)
+        else:
+            fb = framebuf.FrameBuffer(buf, w, h, framebuf.RGB565)
+            fb.fill(_FB_GREEN)
+            ui.font.draw_text(fb, text, 0, 0, 2, _FB_BLACK)
+            ui.display.blit((ui.width - w) // 2, 220, w, h, buf)
         sleep_ms(1000)
     
-    def edit_time_value(self, name, current_value, min_val, max_val):
-        """Edit a time value (hour, minute, day, month, year)"""
+    @micropython.native
+    def edit_time_value(self, title, current_value, min_val, max_val):
+        """Edit a time value (hour, minute, day, month, year) under a ready-made title"""
         last_value = current_value
-        self.ui.draw_number_editor(f"Set {name}", current_value)
+        self.ui.draw_number_editor(title, current_value)
+        
+        joystick = self.hw.joystick
+        buttons = self.hw.buttons
+        ui = self.ui
+        
+        # Auto-repeat state: the direction being held, since when, and when
+        # its next step is due
+        held_dir = None
+        hold_start = 0
+        next_step = 0
         
         while True:
-            direction = self.hw.joystick.wait_for_direction(timeout_ms=30)  # Faster response
-            self.hw.buttons.update()
+            # The wait returns at once while the stick is held, so the
+            # loop period is what paces repeated steps
+            start = ticks_ms()
+            direction = joystick.wait_for_direction(timeout_ms=30)
+            buttons.update()
+            
+            # Steps come from the schedule, not from loop passes, so a slow
+            # redraw never makes a held stick skip ahead
+            step = 0
+            if direction == 'up' or direction == 'down':
+                now = ticks_ms()
+                if direction != held_dir:
+                    held_dir = direction
+                    hold_start = now
+                    next_step = ticks_add(now, _REPEAT_HOLD_MS)
+                    step = 1
+                elif ticks_diff(now, next_step) >= 0:
+                    next_step = ticks_add(now, _REPEAT_MS)
+                    step = _FAST_STEP if ticks_diff(now, hold_start) >= _FAST_HOLD_MS else 1
+            else:
+                held_dir = None
             
             if direction == 'up':
-                current_value = min(max_val, current_value + 1)
+                current_value = min(max_val, current_value + step)
             elif direction == 'down':
-                current_value = max(min_val, current_value - 1)
-            elif direction == 'right' or self.hw.buttons.get_select_press():
+                current_value = max(min_val, current_value - step)
+            elif direction == 'right' or buttons.get_select_press():
                 # Save value
                 return current_value
-            elif direction == 'left' or self.hw.buttons.get_back_press() or self.hw.joystick.get_button_press():
+            elif direction == 'left' or buttons.get_back_press() or joystick.get_button_press():
                 # Cancel
                 return None
                 
-            # Only update display if value changed
+            # Only update display if value changed (at most once per timed step)
             if current_value != last_value:
-                self.ui.draw_number_editor(f"Set {name}", current_value)
+                ui.draw_number_editor(title, current_value)
                 last_value = current_value
                 
-            sleep_ms(20)  # Faster loop
-        
-        return current_value
+            _sleep_rest(start)
+    
+    def _get_wifi(self):
+        """Get the shared WiFiTimeSync instance (imports the module on first use)"""
+        if self._wifi_sync is None:
+            from lib.wifi_time_sync import WiFiTimeSync
+            self._wifi_sync = WiFiTimeSync(self.config)
+        return self._wifi_sync
     
     def setup_wifi(self):
         """WiFi setup wizard"""
         # Import WiFi module
         try:
-            from lib.wifi_time_sync import WiFiTimeSync
-            wifi_sync = WiFiTimeSync(self.config)
+            wifi_sync = self._get_wifi()
         except ImportError:
             self.show_message("WiFi module not available")
             return
             
         # Show WiFi setup screen
-        self.ui.display.fill(0x0000)  # Clear screen
-        self.ui.draw_text_centered("WiFi Setup", 50, 3, 0xFFFF)
-        self.ui.draw_text_centered("Enter WiFi credentials", 80, 1, 0xFFFF)
+        self.ui.display.fill(_BLACK)  # Clear screen
+        self.ui.draw_text_centered("WiFi Setup", 50, 3, _WHITE)
+        self.ui.draw_text_centered("Enter WiFi credentials", 80, 1, _WHITE)
         
         # Simple WiFi setup - for demo purposes
         # In a real implementation, you'd want a proper text input interface
@@ -248,103 +371,120 @@ class PrayerSettings:
         current_password = self.config.get('wifi_password', '')
         
         if current_ssid:
-            self.ui.draw_text_centered(f"Current: {current_ssid}", 120, 1, 0x07E0)
-            self.ui.draw_text_centered("Press RIGHT to test", 160, 1, 0xFFFF)
-            self.ui.draw_text_centered("Press LEFT to exit", 180, 1, 0xFFFF)
+            self.ui.draw_text_centered(f"Current: {current_ssid}", 120, 1, _GREEN)
+            self.ui.draw_text_centered("Press RIGHT to test", 160, 1, _WHITE)
+            self.ui.draw_text_centered("Press LEFT to exit", 180, 1, _WHITE)
             
             while True:
+                start = ticks_ms()
                 direction = self.hw.joystick.wait_for_direction(timeout_ms=30)
                 self.hw.buttons.update()
                 
                 if direction == 'right' or self.hw.buttons.get_select_press():
                     # Test connection
-                    self.ui.draw_text_centered("Testing connection...", 220, 1, 0xFFE0)
+                    self.ui.draw_text_centered("Testing connection...", 220, 1, _YELLOW)
                     if wifi_sync.connect_wifi():
-                        self.ui.draw_text_centered("WiFi Connected!", 240, 2, 0x07E0)
+                        self.ui.draw_text_centered("WiFi Connected!", 240, 2, _GREEN)
                         sleep_ms(1500)  # Reduced wait time
                         wifi_sync.disconnect_wifi()
                     else:
-                        self.ui.draw_text_centered("Connection Failed!", 240, 2, 0xF800)
+                        self.ui.draw_text_centered("Connection Failed!", 240, 2, _RED)
                         sleep_ms(1500)  # Reduced wait time
                     break
                 elif direction == 'left' or self.hw.buttons.get_back_press():
                     break
                     
-                sleep_ms(20)
+                _sleep_rest(start)
         else:
-            self.ui.draw_text_centered("No WiFi configured", 120, 1, 0xF800)
-            self.ui.draw_text_centered("Configure in code", 140, 1, 0xFFFF)
-            self.ui.draw_text_centered("Press any key to exit", 180, 1, 0xFFFF)
+            self.ui.draw_text_centered("No WiFi configured", 120, 1, _RED)
+            self.ui.draw_text_centered("Configure in code", 140, 1, _WHITE)
+            self.ui.draw_text_centered("Press any key to exit", 180, 1, _WHITE)
             
             while True:
+                start = ticks_ms()
                 direction = self.hw.joystick.wait_for_direction(timeout_ms=30)
                 self.hw.buttons.update()
                 
                 if direction or self.hw.buttons.get_select_press() or self.hw.buttons.get_back_press():
                     break
-                sleep_ms(20)
+                _sleep_rest(start)
     
     def sync_time_now(self):
         """Manually sync time with NTP"""
         try:
-            from lib.wifi_time_sync import WiFiTimeSync
-            wifi_sync = WiFiTimeSync(self.config)
+            wifi_sync = self._get_wifi()
         except ImportError:
             self.show_message("WiFi module not available")
             return
             
         # Show sync screen
-        self.ui.display.fill(0x0000)  # Clear screen
-        self.ui.draw_text_centered("Syncing Time...", 100, 3, 0xFFFF)
+        self.ui.display.fill(_BLACK)  # Clear screen
+        self.ui.draw_text_centered("Syncing Time...", 100, 3, _WHITE)
         
         if self.config.get('wifi_ssid'):
-            self.ui.draw_text_centered("Connecting to WiFi...", 140, 1, 0xFFE0)
+            self.ui.draw_text_centered("Connecting to WiFi...", 140, 1, _YELLOW)
             
             if wifi_sync.auto_sync_time():
-                self.ui.draw_text_centered("Time Synchronized!", 180, 2, 0x07E0)
+                self.ui.draw_text_centered("Time Synchronized!", 180, 2, _GREEN)
                 # Show new time
                 year, month, day, weekday, hour, minute, second, _ = self.rtc.datetime()
                 time_str = f"{year}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}"
-                self.ui.draw_text_centered(time_str, 220, 1, 0xFFFF)
+                self.ui.draw_text_centered(time_str, 220, 1, _WHITE)
             else:
-                self.ui.draw_text_centered("Sync Failed!", 180, 2, 0xF800)
-                self.ui.draw_text_centered("Check WiFi settings", 210, 1, 0xFFFF)
+                self.ui.draw_text_centered("Sync Failed!", 180, 2, _RED)
+                self.ui.draw_text_centered("Check WiFi settings", 210, 1, _WHITE)
         else:
-            self.ui.draw_text_centered("No WiFi configured", 140, 1, 0xF800)
-            self.ui.draw_text_centered("Setup WiFi first", 170, 1, 0xFFFF)
+            self.ui.draw_text_centered("No WiFi configured", 140, 1, _RED)
+            self.ui.draw_text_centered("Setup WiFi first", 170, 1, _WHITE)
         
         sleep_ms(3000)  # Show result for 3 seconds
     
     def show_message(self, message):
         """Show a simple message"""
-        self.ui.display.fill(0x0000)
-        self.ui.draw_text_centered(message, 150, 2, 0xFFFF)
+        self.ui.display.fill(_BLACK)
+        self.ui.draw_text_centered(message, 150, 2, _WHITE)
         sleep_ms(2000)
     
     def show_dst_status(self, enabled):
         """Show daylight saving time status"""
         try:
-            from lib.dst_utils import get_current_timezone_offset, format_timezone_display
-            
             base_timezone = self.config.get('timezone', -5)
-            current_offset = get_current_timezone_offset(base_timezone, enabled)
-            timezone_display = format_timezone_display(base_timezone, enabled)
+            now = time.localtime()
+            key = (base_timezone, enabled)
+            today = now[0] * 10000 + now[1] * 100 + now[2]
+            cached = self._dst_cache.get(key)
+            
+            # Format the lines once per timezone state (and again when the date changes)
+            if cached is None or cached[0] != today:
+                from lib.dst_utils import get_current_timezone_offset, format_timezone_display
+                
+                current_offset = get_current_timezone_offset(base_timezone, enabled, now)
+                timezone_line = f"Timezone: {format_timezone_display(base_timezone, enabled)}"
+                
+                # Show base vs current timezone if different
+                if current_offset != base_timezone:
+                    offset_lines = (f"Base: UTC{base_timezone:+d}", f"Current: UTC{current_offset:+d}")
+                else:
+                    offset_lines = None
+                    
+                cached = (today, timezone_line, offset_lines)
+                self._dst_cache[key] = cached
+            _, timezone_line, offset_lines = cached
             
             # Show status
-            self.ui.display.fill(0x0000)
-            self.ui.draw_text_centered("Daylight Saving Time", 80, 2, 0xFFFF)
+            self.ui.display.fill(_BLACK)
+            self.ui.draw_text_centered("Daylight Saving Time", 80, 2, _WHITE)
             
             if enabled:
-                self.ui.draw_text_centered("ENABLED", 120, 3, 0x07E0)  # Green
+                self.ui.draw_text_centered("ENABLED", 120, 3, _GREEN)
             else:
-                self.ui.draw_text_centered("DISABLED", 120, 3, 0xF800)  # Red
+                self.ui.draw_text_centered("DISABLED", 120, 3, _RED)
             
-            self.ui.draw_text_centered(f"Timezone: {timezone_display}", 180, 1, 0xFFFF)
+            self.ui.draw_text_centered(timezone_line, 180, 1, _WHITE)
             
-            # Show base vs current timezone if different
-            if current_offset != base_timezone:
-                self.ui.draw_text_centered(f"Base: UTC{base_timezone:+d}", 210, 1, 0xAAAA)
-                self.ui.draw_text_centered(f"Current: UTC{current_offset:+d}", 230, 1, 0x07E0)
+            if offset_lines:
+                self.ui.draw_text_centered(offset_lines[0], 210, 1, _GREY)
+                self.ui.draw_text_centered(offset_lines[1], 230, 1, _GREEN)
             
             sleep_ms(2000)  # Reduced to 2 seconds for better responsiveness
             
@@ -4,9 +4,33 @@ Based on astronomical calculations
 """
 
 import math
+import micropython
+from micropython import const
+from time import ticks_ms, ticks_diff, ticks_add
 from machine import RTC
 from lib.dst_utils import get_current_timezone_offset
 
+# Angle conversions as plain multiplies (no math.radians/degrees call);
+# _RAD2HOUR turns an hour angle in radians straight into hours (15 deg/hour)
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+_RAD2HOUR = 12.0 / math.pi
+
+# Astronomical and schedule constants for calculate_minutes()
+_J2000 = 2451545.0          # Julian day of the J2000.0 epoch
+_JULIAN_CENTURY = 36525.0   # Days per Julian century
+_SIN_SUNRISE_ALT = math.sin(-0.833 * _DEG2RAD)  # Solar altitude at sunrise/sunset
+_MAGHRIB_DELAY = 3.0 / 60.0  # Maghrib is 3 minutes after sunset, in hours
+
+# Zero-padded "00".."59" for building "HH:MM" without format calls
+_TWO = tuple("%02d" % i for i in range(60))
+
+# update_prayer_times() re-reads the RTC at most this often (and at midnight)
+_CHECK_INTERVAL_MS = const(30000)
+
+# Prayers that count as "next prayer", in day order
+_PRAYER_ORDER = ('Fajr', 'Dhuhr', 'Asr', 'Maghrib', 'Isha')
+
 class PrayerTimes:
     def __init__(self, latitude, longitude, timezone, calculation_method='ISNA', config=None):
         self.latitude = latitude
@@ -32,132 +56,151 @@ class PrayerTimes:
             }
         }
         
+        # Resolve the method once: Fajr/Isha depression angles (negative
+        # altitudes), or a fixed Isha delay in minutes after Maghrib
+        m = self.methods.get(calculation_method, self.methods['ISNA'])
+        self._fajr_angle = -m['fajr']
+        self._isha_param = m['isha']
+        self._isha_is_fixed = m['isha'] > 90
+        
         # Madhab for Asr calculation
         self.asr_madhab = 1  # 1 = Shafi (default), 2 = Hanafi
         
         # RTC for time keeping
         self.rtc = RTC()
         
-        # Prayer times cache
-        self.prayer_times_cache = {}
-        self.last_update_day = -1
+        # Prayer times cache ("HH:MM" strings) and the same times as minute-of-day
+        # ints, so per-tick comparisons never parse strings. The keys never
+        # change, so both dicts are allocated once and updated in place.
+        self.prayer_times_cache = {'Fajr': '', 'Sunrise': '', 'Dhuhr': '',
+                                   'Asr': '', 'Maghrib': '', 'Isha': ''}
+        self.prayer_minutes_cache = {'Fajr': 0, 'Sunrise': 0, 'Dhuhr': 0,
+                                     'Asr': 0, 'Maghrib': 0, 'Isha': 0}
+        
+        # (day, timezone) the caches were computed for; a DST switch mid-day
+        # changes the timezone and so forces a recalculation
+        self._cache_key = (None, None)
+        
+        # ticks_ms() before which update_prayer_times() skips the RTC read
+        self._next_check_ticks = ticks_ms()
+        
+        # [minutes, name, "HH:MM"] for the five prayers, re-sorted in place by time
+        self.prayer_schedule = [[0, name, ''] for name in _PRAYER_ORDER]
+        
+        # Tomorrow's Fajr, the next prayer once today's Isha has passed
+        # (_tomorrow_minutes is scratch space for that calculation)
+        self.tomorrow_fajr = '--:--'
+        self._tomorrow_minutes = dict(self.prayer_minutes_cache)
+        
+        # get_next_prayer() result for the minute of day it was computed in
+        self._next_prayer_cache = None
+        self._next_prayer_minute = -1
         
     def calculate_times(self, year, month, day):
         """Calculate prayer times for a given date"""
+        minutes = {}
+        self.calculate_minutes(year, month, day, minutes)
+        return {name: self.minutes_to_time(m) for name, m in minutes.items()}
+        
+    @micropython.native
+    def calculate_minutes(self, year, month, day, times):
+        """Fill times with the prayer times for a given date as minutes after midnight"""
+        # Latitude and method parameters as locals (kept out of the math below)
+        lat_rad = self.latitude * _DEG2RAD
+        fajr_angle = self._fajr_angle
+        isha_param = self._isha_param
+        
         # Julian day
         julian_day = self.gregorian_to_julian(year, month, day)
         
         # Calculate solar coordinates
-        T = (julian_day - 2451545.0) / 36525  # Julian century
+        T = (julian_day - _J2000) / _JULIAN_CENTURY  # Julian century
         
         # Solar declination and equation of time
         sun_data = self.sun_position(T)
         decl = sun_data['declination']
         eqt = sun_data['equation']
         
+        # Hour angle terms shared by every altitude below:
+        # cos(H) = (sin(altitude) - sin(decl)*sin(lat)) / (cos(decl)*cos(lat))
+        decl_rad = decl * _DEG2RAD
+        A = math.sin(decl_rad) * math.sin(lat_rad)
+        B = math.cos(decl_rad) * math.cos(lat_rad)
+        
         # Calculate transit (solar noon) - this is the key fix
         # Solar noon in local solar time is 12:00
         # Adjust for equation of time
         transit = 12 - eqt
         
-        # Calculate sunrise and sunset
-        sunrise_angle = -0.833  # Solar altitude for sunrise/sunset
-        sunrise = self.calculate_horizon_time(transit, sunrise_angle, decl, False)
-        sunset = self.calculate_horizon_time(transit, sunrise_angle, decl, True)
-        
-        # Get method parameters
-        method = self.methods.get(self.calculation_method, self.methods['ISNA'])
+        # Calculate sunrise and sunset (same hour angle either side of transit)
+        cos_h = max(-1.0, min(1.0, (_SIN_SUNRISE_ALT - A) / B))
+        sun_ha = math.acos(cos_h) * _RAD2HOUR
+        sunrise = transit - sun_ha
+        sunset = transit + sun_ha
         
         # Calculate Fajr (sun is below horizon, so angle is negative)
-        fajr_angle = -method['fajr']  # Make it negative
-        fajr = self.calculate_horizon_time(transit, fajr_angle, decl, False)
+        cos_h = max(-1.0, min(1.0, (math.sin(fajr_angle * _DEG2RAD) - A) / B))
+        fajr = transit - math.acos(cos_h) * _RAD2HOUR
         
         # Calculate Asr
         # Shadow length factor: 1 for Shafi, 2 for Hanafi
         shadow_factor = self.asr_madhab
-        # Calculate the sun altitude angle when shadow = factor * object height
-        asr_angle = math.degrees(math.atan(1.0 / (shadow_factor + math.tan(math.radians(abs(self.latitude - decl))))))
-        # Calculate hour angle
-        cos_h = (math.sin(math.radians(asr_angle)) - 
-                math.sin(math.radians(decl)) * math.sin(math.radians(self.latitude))) / \
-               (math.cos(math.radians(decl)) * math.cos(math.radians(self.latitude)))
-        
-        if cos_h > 1:
-            cos_h = 1
-        elif cos_h < -1:
-            cos_h = -1
-            
-        asr = transit + math.degrees(math.acos(cos_h)) / 15
+        # Calculate the sun altitude (radians) when shadow = factor * object height
+        asr_alt = math.atan(1.0 / (shadow_factor + math.tan(abs(self.latitude - decl) * _DEG2RAD)))
+        cos_h = max(-1.0, min(1.0, (math.sin(asr_alt) - A) / B))
+        asr = transit + math.acos(cos_h) * _RAD2HOUR
         
         # Calculate Maghrib (sunset + 3 minutes)
-        maghrib = sunset + 3/60
+        maghrib = sunset + _MAGHRIB_DELAY
         
         # Calculate Isha
-        if method['isha'] > 90:
+        if self._isha_is_fixed:
             # Fixed time after Maghrib
-            isha = maghrib + method['isha'] / 60
+            isha = maghrib + isha_param / 60
         else:
             # Angle-based calculation (sun is below horizon, so angle is negative)
-            isha_angle = -method['isha']  # Make it negative
-            isha = self.calculate_horizon_time(transit, isha_angle, decl, True)
-        
-        # Prepare times dictionary
-        times = {
-            'Fajr': self.hours_to_time(fajr, True),
-            'Sunrise': self.hours_to_time(sunrise, True),
-            'Dhuhr': self.hours_to_time(transit, True),
-            'Asr': self.hours_to_time(asr, True),
-            'Maghrib': self.hours_to_time(maghrib, True),
-            'Isha': self.hours_to_time(isha, True)
-        }
-        
-        return times
-    
-    def calculate_horizon_time(self, transit, angle, declination, after_transit):
-        """Calculate time for a specific sun altitude angle"""
-        cos_h = (math.sin(math.radians(angle)) - 
-                math.sin(math.radians(declination)) * math.sin(math.radians(self.latitude))) / \
-               (math.cos(math.radians(declination)) * math.cos(math.radians(self.latitude)))
-        
-        if cos_h > 1:
-            cos_h = 1
-        elif cos_h < -1:
-            cos_h = -1
-            
-        hour_angle = math.degrees(math.acos(cos_h)) / 15
-        
-        if after_transit:
-            return transit + hour_angle
-        else:
-            return transit - hour_angle
+            isha_angle = -isha_param  # Make it negative
+            cos_h = max(-1.0, min(1.0, (math.sin(isha_angle * _DEG2RAD) - A) / B))
+            isha = transit + math.acos(cos_h) * _RAD2HOUR
+        
+        # Fill times dictionary
+        times['Fajr'] = self.hours_to_minutes(fajr, True)
+        times['Sunrise'] = self.hours_to_minutes(sunrise, True)
+        times['Dhuhr'] = self.hours_to_minutes(transit, True)
+        times['Asr'] = self.hours_to_minutes(asr, True)
+        times['Maghrib'] = self.hours_to_minutes(maghrib, True)
+        times['Isha'] = self.hours_to_minutes(isha, True)
     
+    @micropython.native
     def sun_position(self, T):
         """Calculate sun's declination and equation of time"""
-        # Mean solar longitude
-        L0 = 280.46646 + 36000.76983 * T + 0.0003032 * T * T
+        # Mean solar longitude (polynomials in T are in Horner form)
+        L0 = (0.0003032 * T + 36000.76983) * T + 280.46646
         L0 = L0 % 360
         
         # Mean anomaly
-        M = 357.52911 + 35999.05029 * T - 0.0001537 * T * T
+        M = (35999.05029 - 0.0001537 * T) * T + 357.52911
         M = M % 360
         
         # Equation of center
-        C = (1.914602 - 0.004817 * T - 0.000014 * T * T) * math.sin(math.radians(M)) + \
-            (0.019993 - 0.000101 * T) * math.sin(math.radians(2 * M)) + \
-            0.000289 * math.sin(math.radians(3 * M))
+        M_rad = M * _DEG2RAD
+        C = (1.914602 - (0.004817 + 0.000014 * T) * T) * math.sin(M_rad) + \
+            (0.019993 - 0.000101 * T) * math.sin(2 * M_rad) + \
+            0.000289 * math.sin(3 * M_rad)
         
         # True longitude
         L = L0 + C
+        L_rad = L * _DEG2RAD
+        sin_L = math.sin(L_rad)
         
         # Obliquity of ecliptic
-        epsilon = 23.439 - 0.00000036 * T
+        epsilon_rad = (23.439 - 0.00000036 * T) * _DEG2RAD
         
         # Declination
-        decl = math.degrees(math.asin(math.sin(math.radians(epsilon)) * math.sin(math.radians(L))))
+        decl = math.asin(math.sin(epsilon_rad) * sin_L) * _RAD2DEG
         
         # Right ascension
-        RA = math.degrees(math.atan2(math.cos(math.radians(epsilon)) * math.sin(math.radians(L)), 
-                                     math.cos(math.radians(L))))
+        RA = math.atan2(math.cos(epsilon_rad) * sin_L, math.cos(L_rad)) * _RAD2DEG
         RA = (RA + 360) % 360
         
         # Equation of time (in hours)
@@ -171,20 +214,31 @@ class PrayerTimes:
             
         return {'declination': decl, 'equation': eqt}
     
+    @micropython.native
     def gregorian_to_julian(self, year, month, day):
         """Convert Gregorian date to Julian day"""
         if month <= 2:
             year -= 1
             month += 12
         
-        a = math.floor(year / 100)
-        b = 2 - a + math.floor(a / 4)
+        # Integer floor division throughout (all operands are positive here);
+        # 365.25*y and 30.6001*m are scaled to exact integer ratios
+        a = year // 100
+        b = 2 - a + a // 4
         
-        jd = math.floor(365.25 * (year + 4716)) + math.floor(30.6001 * (month + 1)) + day + b - 1524.5
+        jd = (1461 * (year + 4716)) // 4 + (306001 * (month + 1)) // 10000 + day + b - 1524.5
         return jd
     
     def hours_to_time(self, hours, apply_timezone=False):
         """Convert decimal hours to time string"""
+        return self.minutes_to_time(self.hours_to_minutes(hours, apply_timezone))
+    
+    def minutes_to_time(self, minutes):
+        """Format minutes after midnight as a 24-hour "HH:MM" string"""
+        return _TWO[minutes // 60] + ":" + _TWO[minutes % 60]
+    
+    def hours_to_minutes(self, hours, apply_timezone=False):
+        """Convert decimal hours to whole minutes after midnight"""
         if apply_timezone:
             # Apply timezone and longitude correction
             # Convert from local solar time to standard time
@@ -193,87 +247,99 @@ class PrayerTimes:
             hours = hours + longitude_correction + self.timezone
             
         # Normalize to 24-hour format
-        while hours < 0:
-            hours += 24
-        while hours >= 24:
-            hours -= 24
+        hours = hours % 24.0
             
         h = int(hours)
         m = int((hours - h) * 60)
         
-        # Return in 24-hour format
-        return f"{h:02d}:{m:02d}"
+        return h * 60 + m
     
-    def update_prayer_times(self):
-        """Calculate prayer times for current day"""
+    def update_prayer_times(self, force=False):
+        """
+        Calculate prayer times for current day
+        The RTC is re-read at most every _CHECK_INTERVAL_MS unless force is set
+        (explicit refreshes and the midnight rollover)
+        """
+        now = ticks_ms()
+        if not force and ticks_diff(self._next_check_ticks, now) > 0 and self._cache_key[0] is not None:
+            return self.prayer_times_cache
+            
         year, month, day, _, hour, minute, second, _ = self.rtc.datetime()
         
+        # Next RTC check in _CHECK_INTERVAL_MS, but never later than midnight
+        # (rounded down a second, as we are already partway through this one)
+        until_midnight = ((23 - hour) * 3600 + (59 - minute) * 60 + (59 - second)) * 1000
+        self._next_check_ticks = ticks_add(now, min(_CHECK_INTERVAL_MS, until_midnight))
+        
         # Update timezone based on DST settings if config is available
         if self.config:
             daylight_saving_enabled = self.config.get('daylight_saving', True)
             self.timezone = get_current_timezone_offset(self.base_timezone, daylight_saving_enabled)
         
-        if day != self.last_update_day:
+        key = (day, self.timezone)
+        if key != self._cache_key:
             print(f"Calculating prayer times for {year}-{month:02d}-{day:02d}")
             print(f"Using timezone: UTC{self.timezone:+d}")
-            self.prayer_times_cache = self.calculate_times(year, month, day)
-            self.last_update_day = day
+            minutes = self.prayer_minutes_cache
+            times = self.prayer_times_cache
+            self.calculate_minutes(year, month, day, minutes)
+            for name, m in minutes.items():
+                times[name] = self.minutes_to_time(m)
+            for entry in self.prayer_schedule:
+                name = entry[1]
+                entry[0] = minutes[name]
+                entry[2] = times[name]
+            self.prayer_schedule.sort()
+            
+            # The Julian day is linear in day, so day + 1 is tomorrow even
+            # across a month or year end
+            tomorrow = self._tomorrow_minutes
+            self.calculate_minutes(year, month, day + 1, tomorrow)
+            self.tomorrow_fajr = self.minutes_to_time(tomorrow['Fajr'])
+            self._cache_key = key
+            self._next_prayer_cache = None
         
         return self.prayer_times_cache
             
     def get_next_prayer(self):
         """Determine the next prayer time"""
-        if not self.prayer_times_cache:
+        if self._cache_key[0] is None:
             self.update_prayer_times()
             
         _, _, _, _, hour, minute, _, _ = self.rtc.datetime()
         current_minutes = hour * 60 + minute
         
-        prayer_order = ['Fajr', 'Dhuhr', 'Asr', 'Maghrib', 'Isha']
-        
-        for prayer in prayer_order:
-            if prayer in self.prayer_times_cache:
-                prayer_time = self.prayer_times_cache[prayer]
-                prayer_hour, prayer_min = map(int, prayer_time.split(':'))
-                prayer_minutes = prayer_hour * 60 + prayer_min
-                
-                if prayer_minutes > current_minutes:
-                    return prayer, prayer_time
+        # The answer only changes when the minute does
+        if current_minutes == self._next_prayer_minute and self._next_prayer_cache:
+            return self._next_prayer_cache
         
         # If all prayers passed, next is Fajr tomorrow
-        return 'Fajr', self.prayer_times_cache.get('Fajr', '--:--')
+        result = ('Fajr', self.tomorrow_fajr)
+        for prayer_minutes, prayer, prayer_time in self.prayer_schedule:
+            if prayer_minutes > current_minutes:
+                result = (prayer, prayer_time)
+                break
+        
+        self._next_prayer_cache = result
+        self._next_prayer_minute = current_minutes
+        return result
     
     def get_prayer_times(self):
         """Get current prayer times (from cache or calculate if needed)"""
-        if not self.prayer_times_cache:
+        if self._cache_key[0] is None:
             self.update_prayer_times()
         return self.prayer_times_cache
     
     def check_prayer_time_alert(self, hour, minute):
         """Check if current time matches any prayer time"""
-        if not self.prayer_times_cache:
+        if self._cache_key[0] is None:
             self.update_prayer_times()
         
-        current_time = f"{hour:02d}:{minute:02d}"
+        current_minutes = hour * 60 + minute
         
         # Check if current time matches any prayer time
-        for prayer_name, prayer_time in self.prayer_times_cache.items():
-            if prayer_time == current_time:
+        for prayer_name, prayer_minutes in self.prayer_minutes_cache.items():
+            if prayer_minutes == current_minutes:
                 return prayer_name
         
-        return None
-
-# Test the fixed implementation
-if __name__ == "__main__":
-    # Tampa coordinates
-    latitude = 27.9506
-    longitude = -82.4572
-    timezone = -4  # EDT
-    
-    calc = PrayerTimesFixed(latitude, longitude, timezone, 'ISNA')
-    times = calc.calculate_times(2025, 9, 3)
-    
-    print("Prayer Times for Tampa, FL - September 3, 2025")
-    print("=" * 50)
-    for prayer, time in times.items():
-        print(f"{prayer:8s}: {time}")
\ No newline at end of file
+        return None
\ No newline at end of file
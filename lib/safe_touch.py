@@ -3,7 +3,7 @@ Safe Touch Screen Handler for Muslim Companion
 Handles I2C errors gracefully and provides fallback behavior
 """
 
-import time
+from time import ticks_ms, ticks_diff, ticks_add
 from machine import I2C, Pin
 
 class SafeTouch:
@@ -16,17 +16,17 @@ class SafeTouch:
         self.error_timeout = 5000  # 5 seconds
         self.disabled = False
         
+        # Reset backoff: at most one controller re-init per reset_interval,
+        # since init() can block the UI loop when the bus is failing
+        self.reset_interval = 2000  # ms
+        self.last_reset_time = ticks_add(ticks_ms(), -self.reset_interval)
+        
     def get_touch(self):
         """Safely get touch data with error handling"""
-        # If touch is disabled due to errors, return None
-        if self.disabled:
-            # Check if we should try to re-enable
-            if time.ticks_diff(time.ticks_ms(), self.last_error_time) > self.error_timeout:
-                print("Attempting to re-enable touch...")
-                self.disabled = False
-                self.error_count = 0
-            else:
-                return None
+        # Hot path is a single attribute test; while disabled due to errors,
+        # return None until the error timeout allows another try
+        if self.disabled and not self._try_reenable():
+            return None
         
         try:
             # Attempt to get touch data
@@ -36,7 +36,7 @@ class SafeTouch:
             # Handle I2C errors
             if e.errno == 5:  # EIO - Input/Output error
                 self.error_count += 1
-                self.last_error_time = time.ticks_ms()
+                self.last_error_time = ticks_ms()
                 
                 if self.error_count >= self.max_errors:
                     print(f"Touch disabled due to {self.error_count} errors")
@@ -54,8 +54,22 @@ class SafeTouch:
             # Silently ignore other errors
             return None
     
+    def _try_reenable(self):
+        """Re-enable touch once error_timeout has passed since the last error"""
+        if ticks_diff(ticks_ms(), self.last_error_time) <= self.error_timeout:
+            return False
+        print("Attempting to re-enable touch...")
+        self.disabled = False
+        self.error_count = 0
+        return True
+    
     def try_reset_i2c(self):
-        """Attempt to reset the I2C bus"""
+        """Attempt to reset the I2C bus (skipped if one was attempted recently)"""
+        now = ticks_ms()
+        if ticks_diff(now, self.last_reset_time) < self.reset_interval:
+            return
+        self.last_reset_time = now
+        
         try:
             print("Attempting I2C reset...")
             # Try to reinitialize the touch controller
@@ -5,7 +5,91 @@ Robust input handling without complex UI blocking
 
 import time
 from machine import RTC
-from time import sleep_ms
+import framebuf
+from micropython import const
+
+# Debug logging to the USB console; with 0 the compiler drops the print blocks
+_DEBUG = const(0)
+
+# Config values shown in the settings menu, with their defaults
+_MENU_CONFIG = (
+    ('location_name', 'Tampa'),
+    ('method', 'ISNA'),
+    ('daylight_saving', True),
+    ('buzzer_enabled', True),
+    ('buzzer_duration', 5),
+    ('time_format', '12h'),
+    ('ntp_enabled', True),
+    ('sleep_mode_enabled', False),
+    ('sleep_timeout', 30),
+)
+
+# Menu rows as (label prefix, config key or None, value suffix); the shown
+# text is built from the cached config value whenever a row is drawn
+_MENU_ROWS = (
+    ("Set Clock Time", None, ""),
+    ("WiFi Setup", None, ""),
+    ("Sync Time Now", None, ""),
+    ("Location: ", 'location_name', ""),
+    ("Calc Method: ", 'method', ""),
+    ("Daylight Saving: ", 'daylight_saving', ""),
+    ("Buzzer: ", 'buzzer_enabled', ""),
+    ("Buzzer Duration: ", 'buzzer_duration', "s"),
+    ("Time Format: ", 'time_format', ""),
+    ("Auto Time Sync: ", 'ntp_enabled', ""),
+    ("Sleep Mode: ", 'sleep_mode_enabled', ""),
+    ("Sleep Timeout: ", 'sleep_timeout', "s"),
+    ("Exit Settings", None, ""),
+)
+
+# RGB565 colors used by the settings screens
+_BLACK = const(0x0000)
+_WHITE = const(0xFFFF)
+_BLUE = const(0x001F)
+_GREEN = const(0x07E0)
+_RED = const(0xF800)
+_GREY = const(0xC618)
+_DIM = const(0x7BEF)
+_DARK_GREY = const(0x2104)
+
+# Longest idle between joystick samples; the axes are analog (no IRQ), while
+# button and joystick-press edges are latched by the drivers' pin IRQs. The
+# idle is time.sleep_ms, not lightsleep, which drops the USB REPL.
+INPUT_SAMPLE_MS = const(20)
+
+# An input source that raises is skipped for ERROR_HOLD_MS, doubling on each
+# repeated failure up to ERROR_HOLD_MAX_MS; a good read clears the hold
+ERROR_HOLD_MS = const(2000)
+ERROR_HOLD_MAX_MS = const(30000)
+_SRC_JOYSTICK = const(0)
+_SRC_BUTTONS = const(1)
+_SRC_TOUCH = const(2)
+
+# Menu layout
+MENU_MAX_VISIBLE = const(8)
+MENU_Y_START = const(60)
+MENU_ITEM_HEIGHT = const(35)
+MENU_POS_Y = const(380)
+MENU_ROW_X = const(10)
+MENU_ROW_WIDTH = const(300)
+
+# Text is rendered into a RAM strip and sent with one blit, since the font
+# plots through pixel() (one display transaction per lit pixel). The strip
+# holds one screen-wide line of size-2 text.
+TEXT_STRIP_BYTES = const(320 * 14 * 2)
+
+def _fb_color(color):
+    """Byte-swap an RGB565 color for framebuf (little-endian) -> ST7796 (big-endian)"""
+    return ((color & 0xFF) << 8) | (color >> 8)
+
+# Bottom navigation touch zones: three equal tabs below NAV_TOUCH_Y
+NAV_TOUCH_Y = const(400)
+NAV_TAB_WIDTH = const(107)
+
+# Bottom navigation bar as drawn
+NAV_Y = const(420)
+NAV_HEIGHT = const(60)
+NAV_TAB_DRAW_WIDTH = const(106)
 
 class SimpleSettings:
     def __init__(self, ui, hw, config):
@@ -15,13 +99,69 @@ class SimpleSettings:
         self.config = config
         self.rtc = RTC()
         
-        # Input debouncing
-        self.last_input_time = 0
+        # Input debouncing, tracked per source so a touch does not
+        # suppress a button press (and vice versa)
+        self.last_joystick_time = 0
+        self.last_button_time = 0
+        self.last_touch_time = 0
         self.debounce_ms = 150
         
+        # Error hold per input source (ms, 0 = healthy) and when it ends
+        self._error_hold = [0, 0, 0]
+        self._retry_at = [0, 0, 0]
+        
+        # Text strip buffer, allocated on the first menu draw (see _blit_text)
+        self._text_buf = None
+        
+        # City list and name -> position map, built on first Location press
+        self._cities = None
+        self._city_index = None
+        
+        # Menu config values, read once per menu entry (see _load_cfg)
+        self._cfg_cache = {}
+        
+        # Rows whose value changed and need repainting (no full redraw)
+        self.dirty_rows = set()
+        
+        # Touch controller resolved once (None if absent or failed to start);
+        # drivers with a 'pending' INT flag are only read after a report
+        self._touch = getattr(hw, 'touch', None) or None
+        self._touch_has_pending = hasattr(self._touch, 'pending')
+        
+        # Event for each bottom tab column (Settings is current, so ignored)
+        self._tabs = ('tab_prayer', 'tab_hijri', None)
+        
+    def _load_cfg(self):
+        """Read every menu config value in a single pass"""
+        get = self.config.get
+        self._cfg_cache = {key: get(key, default) for key, default in _MENU_CONFIG}
+        
+    def _set(self, key, value):
+        """Store a setting in both the menu cache and the config"""
+        self._cfg_cache[key] = value
+        self.config.set(key, value)
+        
+    def _label(self, index):
+        """Menu row text: prefix plus the formatted cached value"""
+        prefix, key, suffix = _MENU_ROWS[index]
+        if key is None:
+            return prefix
+        value = self._cfg_cache[key]
+        if value is True or value is False:
+            return prefix + ("ON" if value else "OFF")
+        return prefix + str(value) + suffix
+        
+    def _hold_input(self, source, now):
+        """Skip a failing input source for a while, doubling the hold on repeats"""
+        hold = self._error_hold[source]
+        hold = min(hold * 2, ERROR_HOLD_MAX_MS) if hold else ERROR_HOLD_MS
+        self._error_hold[source] = hold
+        self._retry_at[source] = time.ticks_add(now, hold)
+        
     def show_settings_menu(self):
         """Show settings with reliable input handling"""
-        print("=== ENTERING SETTINGS ===")
+        if _DEBUG:
+            print("=== ENTERING SETTINGS ===")
         
         # Verify hardware is accessible (only print once)
         try:
@@ -30,68 +170,81 @@ class SimpleSettings:
             buttons_ok = self.hw.buttons is not None
             
             if not joystick_ok or not buttons_ok:
-                print(f"Hardware status - Joystick: {joystick_ok}, Touch: {touch_ok}, Buttons: {buttons_ok}")
+                if _DEBUG:
+                    print(f"Hardware status - Joystick: {joystick_ok}, Touch: {touch_ok}, Buttons: {buttons_ok}")
         except Exception as e:
             print(f"Hardware access error: {e}")
             return True
         
-        settings_items = [
-            "Set Clock Time",
-            "WiFi Setup",
-            "Sync Time Now",
-            "Location: " + self.config.get('location_name', 'Tampa'),
-            "Calc Method: " + self.config.get('method', 'ISNA'),
-            "Daylight Saving: " + ("ON" if self.config.get('daylight_saving', True) else "OFF"),
-            "Buzzer: " + ("ON" if self.config.get('buzzer_enabled', True) else "OFF"),
-            "Buzzer Duration: " + str(self.config.get('buzzer_duration', 5)) + "s",
-            "Time Format: " + self.config.get('time_format', '12h'),
-            "Auto Time Sync: " + ("ON" if self.config.get('ntp_enabled', True) else "OFF"),
-            "Sleep Mode: " + ("ON" if self.config.get('sleep_mode_enabled', False) else "OFF"),
-            "Sleep Timeout: " + str(self.config.get('sleep_timeout', 30)) + "s",
-            "Exit Settings"
-        ]
+        self._load_cfg()
+        cfg = self._cfg_cache
+        
+        # Bind hot-loop names to locals
+        last_row = len(_MENU_ROWS) - 1
+        dirty_rows = self.dirty_rows
+        wait_for_input = self.wait_for_input
+        dirty_rows.clear()
         
         selected_index = 0
         last_selected_index = -1  # Track changes
         needs_redraw = True  # Initial draw needed
         
         while True:
-            # Only draw if something changed
-            if needs_redraw or selected_index != last_selected_index:
-                try:
-                    self.draw_simple_menu(settings_items, selected_index)
-                    last_selected_index = selected_index
+            # Only draw what changed: the whole screen on entry, the visible rows
+            # when the menu scrolls, the two highlight rows on a cursor move,
+            # or just the rows whose value changed
+            try:
+                if needs_redraw:
+                    self.draw_simple_menu(selected_index)
                     needs_redraw = False
-                except Exception as e:
-                    print(f"Drawing error: {e}")
+                elif self._menu_start(selected_index) != self._menu_start(last_selected_index):
+                    self.draw_simple_menu(selected_index, last_selected_index)
+                elif selected_index != last_selected_index:
+                    self.draw_menu_row(last_selected_index, selected_index)
+                    self.draw_menu_row(selected_index, selected_index)
+                    self.draw_menu_position(selected_index)
+                for row in dirty_rows:
+                    self.draw_menu_row(row, selected_index)
+            except Exception as e:
+                print(f"Drawing error: {e}")
+            dirty_rows.clear()
+            last_selected_index = selected_index
             
             # Handle input with timeout
-            input_result = self.wait_for_input(timeout_ms=100)
+            input_result = wait_for_input(100)
             
             if input_result == 'up':
-                selected_index = (selected_index - 1) % len(settings_items)
+                selected_index -= 1
+                if selected_index < 0:
+                    selected_index = last_row
                 # Don't print every selection change - causes console spam
                 
             elif input_result == 'down':
-                selected_index = (selected_index + 1) % len(settings_items)
+                selected_index += 1
+                if selected_index > last_row:
+                    selected_index = 0
                 # Don't print every selection change - causes console spam
                 
             elif input_result == 'left':
                 # Navigate to previous tab (hijri)
-                print("Switching to Hijri tab")
+                if _DEBUG:
+                    print("Switching to Hijri tab")
                 return 'hijri'
                 
             elif input_result == 'right':
                 # Navigate to next tab (prayer)
-                print("Switching to Prayer tab")
+                if _DEBUG:
+                    print("Switching to Prayer tab")
                 return 'prayer'
                 
             elif input_result == 'select':
-                print(f"Settings: Selecting item {selected_index}: {settings_items[selected_index]}")
+                if _DEBUG:
+                    print(f"Settings: Selecting item {selected_index}: {self._label(selected_index)}")
                 # Handle different settings
                 
                 if selected_index == 0:  # Set Clock Time
-                    print("Clock setting not yet implemented in simple mode")
+                    if _DEBUG:
+                        print("Clock setting not yet implemented in simple mode")
                     
                 elif selected_index == 1:  # WiFi Setup
                     self.show_wifi_setup()
@@ -103,78 +256,67 @@ class SimpleSettings:
                     
                 elif selected_index == 3:  # Location
                     # Cycle through US cities
-                    cities = self.config.get_us_cities()
-                    current = self.config.get('location_name', 'Tampa')
+                    cities = self._cities
+                    if cities is None:
+                        cities = self._cities = self.config.get_us_cities()
+                        self._city_index = {city['name']: i for i, city in enumerate(cities)}
                     
-                    # Find current city
-                    current_idx = 0
-                    for i, city in enumerate(cities):
-                        if city['name'] == current:
-                            current_idx = i
-                            break
-                    
-                    # Select next city
-                    new_idx = (current_idx + 1) % len(cities)
+                    # Select next city (unknown names start from the first)
+                    new_idx = (self._city_index.get(cfg['location_name'], 0) + 1) % len(cities)
                     new_city = cities[new_idx]
                     
                     # Update location with all data
                     self.config.update_location(new_city)
-                    settings_items[3] = f"Location: {new_city['name']}"
-                    needs_redraw = True
-                    print(f"Location changed to {new_city['name']}")
+                    cfg['location_name'] = new_city['name']
+                    dirty_rows.add(3)
+                    if _DEBUG:
+                        print(f"Location changed to {new_city['name']}")
                     
                 elif selected_index == 4:  # Calc Method
                     methods = ['ISNA', 'MWL', 'Mecca']
-                    current = self.config.get('method', 'ISNA')
+                    current = cfg['method']
                     try:
                         idx = methods.index(current)
                         new_method = methods[(idx + 1) % len(methods)]
                     except:
                         new_method = methods[0]
-                    self.config.set('method', new_method)
-                    settings_items[4] = f"Calc Method: {new_method}"
-                    needs_redraw = True
+                    self._set('method', new_method)
+                    dirty_rows.add(4)
                     
                 elif selected_index == 5:  # Daylight Saving
-                    current = self.config.get('daylight_saving', True)
-                    self.config.set('daylight_saving', not current)
-                    settings_items[5] = "Daylight Saving: " + ("ON" if not current else "OFF")
-                    needs_redraw = True
+                    current = cfg['daylight_saving']
+                    self._set('daylight_saving', not current)
+                    dirty_rows.add(5)
                     
                 elif selected_index == 6:  # Buzzer
-                    current = self.config.get('buzzer_enabled', True)
-                    self.config.set('buzzer_enabled', not current)
-                    settings_items[6] = "Buzzer: " + ("ON" if not current else "OFF")
-                    needs_redraw = True
+                    current = cfg['buzzer_enabled']
+                    self._set('buzzer_enabled', not current)
+                    dirty_rows.add(6)
                     
                 elif selected_index == 7:  # Buzzer Duration
-                    current = self.config.get('buzzer_duration', 5)
+                    current = cfg['buzzer_duration']
                     new_duration = current + 1 if current < 10 else 1
-                    self.config.set('buzzer_duration', new_duration)
-                    settings_items[7] = f"Buzzer Duration: {new_duration}s"
-                    needs_redraw = True
+                    self._set('buzzer_duration', new_duration)
+                    dirty_rows.add(7)
                     
                 elif selected_index == 8:  # Time Format
-                    current = self.config.get('time_format', '12h')
+                    current = cfg['time_format']
                     new_format = '24h' if current == '12h' else '12h'
-                    self.config.set('time_format', new_format)
-                    settings_items[8] = f"Time Format: {new_format}"
-                    needs_redraw = True
+                    self._set('time_format', new_format)
+                    dirty_rows.add(8)
                     
                 elif selected_index == 9:  # Auto Time Sync
-                    current = self.config.get('ntp_enabled', True)
-                    self.config.set('ntp_enabled', not current)
-                    settings_items[9] = "Auto Time Sync: " + ("ON" if not current else "OFF")
-                    needs_redraw = True
+                    current = cfg['ntp_enabled']
+                    self._set('ntp_enabled', not current)
+                    dirty_rows.add(9)
                     
                 elif selected_index == 10:  # Sleep Mode
-                    current = self.config.get('sleep_mode_enabled', False)
-                    self.config.set('sleep_mode_enabled', not current)
-                    settings_items[10] = "Sleep Mode: " + ("ON" if not current else "OFF")
-                    needs_redraw = True
+                    current = cfg['sleep_mode_enabled']
+                    self._set('sleep_mode_enabled', not current)
+                    dirty_rows.add(10)
                     
                 elif selected_index == 11:  # Sleep Timeout
-                    current = self.config.get('sleep_timeout', 30)
+                    current = cfg['sleep_timeout']
                     # Cycle through timeouts: 10, 30, 60, 120, 300 seconds
                     timeouts = [10, 30, 60, 120, 300]
                     try:
@@ -182,16 +324,17 @@ class SimpleSettings:
                         new_timeout = timeouts[(idx + 1) % len(timeouts)]
                     except:
                         new_timeout = timeouts[0]
-                    self.config.set('sleep_timeout', new_timeout)
-                    settings_items[11] = f"Sleep Timeout: {new_timeout}s"
-                    needs_redraw = True
+                    self._set('sleep_timeout', new_timeout)
+                    dirty_rows.add(11)
                     
                 elif selected_index == 12:  # Exit
-                    print("Exiting settings")
+                    if _DEBUG:
+                        print("Exiting settings")
                     break
                     
             elif input_result == 'exit':
-                print("Exiting settings")
+                if _DEBUG:
+                    print("Exiting settings")
                 break
                 
             elif input_result == 'tab_prayer':
@@ -202,192 +345,264 @@ class SimpleSettings:
         return True
     
     def wait_for_input(self, timeout_ms=100):
-        """Wait for any input with timeout"""
-        start_time = time.ticks_ms()
+        """Wait for any input with timeout, idling between samples"""
+        # Bind hot-loop names to locals (globals and self.x.y are dict lookups)
+        ticks_ms = time.ticks_ms
+        ticks_diff = time.ticks_diff
+        sleep_ms = time.sleep_ms
+        joystick = self.hw.joystick
+        buttons = self.hw.buttons
+        touch = self._touch
+        touch_has_pending = self._touch_has_pending
+        debounce_ms = self.debounce_ms
+        error_hold = self._error_hold
+        retry_at = self._retry_at
+        
+        start_time = ticks_ms()
         
         while True:
-            current_time = time.ticks_ms()
+            current_time = ticks_ms()
             
             # Check timeout
-            if time.ticks_diff(current_time, start_time) > timeout_ms:
+            if ticks_diff(current_time, start_time) > timeout_ms:
                 return None
             
-            # Debounce check
-            if time.ticks_diff(current_time, self.last_input_time) < self.debounce_ms:
-                time.sleep_ms(10)
+            # Debounce check: a source inside its window is not read at all;
+            # if every source is, sleep until the first window ends
+            joystick_wait = debounce_ms - ticks_diff(current_time, self.last_joystick_time)
+            button_wait = debounce_ms - ticks_diff(current_time, self.last_button_time)
+            touch_wait = debounce_ms - ticks_diff(current_time, self.last_touch_time)
+            
+            # Sources on an error hold wait it out too (capped by the hold
+            # length so a stale deadline can never stall a source for longer)
+            if error_hold[_SRC_JOYSTICK]:
+                joystick_wait = max(joystick_wait, min(ticks_diff(retry_at[_SRC_JOYSTICK], current_time),
+                                                       error_hold[_SRC_JOYSTICK]))
+            if error_hold[_SRC_BUTTONS]:
+                button_wait = max(button_wait, min(ticks_diff(retry_at[_SRC_BUTTONS], current_time),
+                                                   error_hold[_SRC_BUTTONS]))
+            if error_hold[_SRC_TOUCH]:
+                touch_wait = max(touch_wait, min(ticks_diff(retry_at[_SRC_TOUCH], current_time),
+                                                 error_hold[_SRC_TOUCH]))
+            if joystick_wait > 0 and button_wait > 0 and touch_wait > 0:
+                time_left = timeout_ms - ticks_diff(current_time, start_time)
+                sleep_ms(max(1, min(joystick_wait, button_wait, touch_wait, time_left)))
                 continue
             
             # === CHECK JOYSTICK ===
-            try:
-                direction = self.hw.joystick.get_direction()
-                if direction and direction != 'center':
-                    self.last_input_time = current_time
-                    return direction
-                    
-                if self.hw.joystick.get_button_press():
-                    self.last_input_time = current_time
-                    return 'select'
-                    
-            except Exception as e:
-                print(f"Joystick input error: {e}")
+            if joystick_wait <= 0:
+                try:
+                    direction = joystick.get_direction()
+                    error_hold[_SRC_JOYSTICK] = 0
+                    if direction and direction != 'center':
+                        self.last_joystick_time = current_time
+                        return direction
+                        
+                    if joystick.get_button_press():
+                        self.last_joystick_time = current_time
+                        return 'select'
+                        
+                except Exception as e:
+                    print(f"Joystick input error: {e}")
+                    self._hold_input(_SRC_JOYSTICK, current_time)
             
             # === CHECK PHYSICAL BUTTONS ===
-            try:
-                self.hw.buttons.update()
-                if self.hw.buttons.get_select_press():
-                    print("Settings: Button 1 (select) detected")
-                    self.last_input_time = current_time
-                    return 'select'
-                    
-                if self.hw.buttons.get_back_press():
-                    print("Settings: Button 2 (back) detected")
-                    self.last_input_time = current_time
-                    return 'exit'
-                    
-            except Exception as e:
-                print(f"Button input error: {e}")
+            # (presses latched meanwhile by the button IRQs are kept until read)
+            if button_wait <= 0:
+                try:
+                    buttons.update()
+                    error_hold[_SRC_BUTTONS] = 0
+                    if buttons.get_select_press():
+                        if _DEBUG:
+                            print("Settings: Button 1 (select) detected")
+                        self.last_button_time = current_time
+                        return 'select'
+                        
+                    if buttons.get_back_press():
+                        if _DEBUG:
+                            print("Settings: Button 2 (back) detected")
+                        self.last_button_time = current_time
+                        return 'exit'
+                        
+                except Exception as e:
+                    print(f"Button input error: {e}")
+                    self._hold_input(_SRC_BUTTONS, current_time)
             
             # === CHECK TOUCH SCREEN ===
-            # Skip touch if it's having I2C errors
-            if hasattr(self.hw, 'touch') and self.hw.touch:
+            # Skip touch if it's having I2C errors; only read it over I2C
+            # once the controller's INT pin has signalled a report
+            if touch_wait <= 0 and touch is not None and (not touch_has_pending or touch.pending):
                 try:
-                    touch_data = self.hw.touch.get_touch()
+                    touch_data = touch.get_touch()
+                    error_hold[_SRC_TOUCH] = 0
                     if touch_data:
                         x, y = touch_data[0], touch_data[1]
-                        print(f"Touch detected: {x}, {y}")
+                        if _DEBUG:
+                            print(f"Touch detected: {x}, {y}")
                         
                         # Simple touch zones
-                        if y > 400:  # Bottom navigation area
-                            if x < 107:  # Prayer tab
-                                self.last_input_time = current_time
-                                return 'tab_prayer'
-                            elif x < 214:  # Hijri tab
-                                self.last_input_time = current_time
-                                return 'tab_hijri'
-                            # Settings tab is current, ignore
+                        if y > NAV_TOUCH_Y:  # Bottom navigation area
+                            event = self._tabs[min(x // NAV_TAB_WIDTH, 2)]
+                            if event:
+                                self.last_touch_time = current_time
+                                return event
                         else:  # Settings area
-                            self.last_input_time = current_time
+                            self.last_touch_time = current_time
                             return 'select'
                             
                 except OSError as e:
-                    if e.errno == 5:  # I2C error
-                        # Silently ignore I2C errors
-                        pass
-                    else:
+                    if e.errno != 5:  # I2C errors are expected, stay quiet
                         print(f"Touch error: {e}")
+                    self._hold_input(_SRC_TOUCH, current_time)
                 except:
                     # Silently ignore other touch errors
-                    pass
+                    self._hold_input(_SRC_TOUCH, current_time)
             
-            time.sleep_ms(20)  # Slightly longer sleep to reduce CPU usage
+            # Nothing latched - idle until the next sample (IRQs still latch meanwhile)
+            remaining = timeout_ms - ticks_diff(ticks_ms(), start_time)
+            if remaining > 0:
+                sleep_ms(min(remaining, INPUT_SAMPLE_MS))
+    
+    def _menu_start(self, selected):
+        """First visible row index for a given selection (the menu scrolls)"""
+        if selected < MENU_MAX_VISIBLE:
+            return 0
+        return selected - MENU_MAX_VISIBLE + 1
     
-    def draw_simple_menu(self, items, selected):
-        """Draw settings menu with scrolling support"""
+    def _blit_text(self, text, y, size, color, bg, x=0, width=None):
+        """Draw text centered in [x, x + width) on a bg strip with a single SPI write"""
+        ui = self.ui
+        if width is None:
+            width = ui.width
+        font = ui.font
+        h = font.get_text_height(size)
+        w = min(font.get_text_width(text, size), width, TEXT_STRIP_BYTES // (h * 2))
+        if w <= 0:
+            return
+        
+        buf = self._text_buf
+        if buf is None:
+            buf = self._text_buf = bytearray(TEXT_STRIP_BYTES)
+        strip = memoryview(buf)[:w * h * 2]
+        fb = framebuf.FrameBuffer(strip, w, h, framebuf.RGB565)
+        fb.fill(_fb_color(bg))
+        font.draw_text(fb, text, 0, 0, size, _fb_color(color))
+        ui.display.blit(x + (width - w) // 2, y, w, h, strip)
+        
+    def draw_simple_menu(self, selected, prev_selected=None):
+        """
+        Draw settings menu with scrolling support
+        With prev_selected (menu already on screen) only the rows and scroll
+        indicator are repainted; title and bottom navigation are left as-is
+        """
         try:
-            # Clear screen
-            self.ui.display.clear(0x0000)  # Black using UI manager's clear method
-            
-            # Draw title
-            self.ui.draw_text_centered("Settings", 20, 2, 0xFFFF)
-            
-            # Calculate visible items (max 8 items to fit on screen)
-            max_visible = 8
-            y_start = 60
-            item_height = 35
-            
-            # Calculate scroll offset
-            if selected < max_visible:
-                start_idx = 0
-            else:
-                start_idx = selected - max_visible + 1
-            
-            end_idx = min(start_idx + max_visible, len(items))
-            
-            # Draw visible menu items
-            for display_idx, i in enumerate(range(start_idx, end_idx)):
-                y_pos = y_start + display_idx * item_height
-                
-                if i == selected:
-                    # Highlight selected item
-                    self.ui.display.fill_rect(10, y_pos - 5, 300, item_height - 5, 0x001F)  # Blue background
-                    color = 0xFFFF  # White text
-                else:
-                    color = 0xC618  # Gray text
+            fresh = prev_selected is None
+            if fresh:
+                # Clear screen
+                self.ui.display.clear(_BLACK)
                 
-                # Draw text using UI manager
-                self.ui.draw_text_centered(items[i], y_pos + 5, 1, color)
+                # Draw title
+                self._blit_text("Settings", 20, 2, _WHITE, _BLACK)
+            
+            # Draw visible menu items (each row paints its own background
+            # unless it is drawn over a fresh black screen)
+            start_idx = self._menu_start(selected)
+            end_idx = min(start_idx + MENU_MAX_VISIBLE, len(_MENU_ROWS))
+            for i in range(start_idx, end_idx):
+                self.draw_menu_row(i, selected, clear=not fresh)
             
             # Draw scroll indicator if needed
-            if len(items) > max_visible:
-                # Show current position
-                pos_text = f"{selected + 1}/{len(items)}"
-                self.ui.draw_text_centered(pos_text, 380, 1, 0x7BEF)
+            self.draw_menu_position(selected, clear=not fresh)
             
             # Draw bottom navigation
-            self.draw_bottom_nav()
+            if fresh:
+                self.draw_bottom_nav()
             
         except Exception as e:
             print(f"Menu drawing error: {e}")
     
+    def draw_menu_row(self, index, selected, clear=True):
+        """Draw one menu row (clear=False skips the background on a fresh screen)"""
+        y_pos = MENU_Y_START + (index - self._menu_start(selected)) * MENU_ITEM_HEIGHT
+        
+        if index == selected:
+            # Highlight selected item
+            self.ui.display.fill_rect(MENU_ROW_X, y_pos - 5, MENU_ROW_WIDTH, MENU_ITEM_HEIGHT - 5, _BLUE)
+            color, bg = _WHITE, _BLUE  # White text
+        else:
+            if clear:
+                self.ui.display.fill_rect(MENU_ROW_X, y_pos - 5, MENU_ROW_WIDTH, MENU_ITEM_HEIGHT - 5, _BLACK)
+            color, bg = _GREY, _BLACK  # Gray text
+        
+        # Draw text as one strip over the row background
+        self._blit_text(self._label(index), y_pos + 5, 1, color, bg)
+    
+    def draw_menu_position(self, selected, clear=True):
+        """Draw the "n/total" scroll indicator when the menu does not fit"""
+        if len(_MENU_ROWS) > MENU_MAX_VISIBLE:
+            if clear:
+                self.ui.display.fill_rect(0, MENU_POS_Y, self.ui.width, self.ui.font.get_text_height(1), _BLACK)
+            pos_text = f"{selected + 1}/{len(_MENU_ROWS)}"
+            self._blit_text(pos_text, MENU_POS_Y, 1, _DIM, _BLACK)
+    
     def draw_bottom_nav(self):
         """Draw bottom navigation with proper tab names"""
         try:
-            nav_y = 420
-            nav_height = 60
-            tab_width = 106
-            
             # Prayer tab (inactive)
-            self.ui.display.fill_rect(0, nav_y, tab_width, nav_height, 0x2104)  # Dark gray
-            self.ui.draw_text_centered_in_area("Prayer", 0, nav_y + 20, tab_width, 1, 0xC618)
+            self.ui.display.fill_rect(0, NAV_Y, NAV_TAB_DRAW_WIDTH, NAV_HEIGHT, _DARK_GREY)
+            self._blit_text("Prayer", NAV_Y + 20, 1, _GREY, _DARK_GREY, 0, NAV_TAB_DRAW_WIDTH)
             
             # Hijri tab (inactive)
-            self.ui.display.fill_rect(tab_width + 1, nav_y, tab_width, nav_height, 0x2104)  # Dark gray
-            self.ui.draw_text_centered_in_area("Events", tab_width + 1, nav_y + 20, tab_width, 1, 0xC618)
+            self.ui.display.fill_rect(NAV_TAB_DRAW_WIDTH + 1, NAV_Y, NAV_TAB_DRAW_WIDTH, NAV_HEIGHT, _DARK_GREY)
+            self._blit_text("Events", NAV_Y + 20, 1, _GREY, _DARK_GREY, NAV_TAB_DRAW_WIDTH + 1, NAV_TAB_DRAW_WIDTH)
             
             # Settings tab (active - highlighted)
-            self.ui.display.fill_rect((tab_width * 2) + 2, nav_y, tab_width, nav_height, 0x001F)  # Blue
-            self.ui.draw_text_centered_in_area("Settings", (tab_width * 2) + 2, nav_y + 20, tab_width, 1, 0xFFFF)
+            self.ui.display.fill_rect((NAV_TAB_DRAW_WIDTH * 2) + 2, NAV_Y, NAV_TAB_DRAW_WIDTH, NAV_HEIGHT, _BLUE)
+            self._blit_text("Settings", NAV_Y + 20, 1, _WHITE, _BLUE, (NAV_TAB_DRAW_WIDTH * 2) + 2, NAV_TAB_DRAW_WIDTH)
             
             # Draw navigation hints
-            self.ui.draw_text_centered("← → Switch Tabs", nav_y - 20, 1, 0x7BEF)
+            self._blit_text("← → Switch Tabs", NAV_Y - 20, 1, _DIM, _BLACK)
             
         except Exception as e:
             print(f"Navigation drawing error: {e}")
     
     def sync_time_now(self):
         """Perform immediate time synchronization"""
-        print("Attempting time sync...")
+        if _DEBUG:
+            print("Attempting time sync...")
         try:
             # Import WiFi time sync
             from lib.wifi_time_sync import WiFiTimeSync
             wifi_sync = WiFiTimeSync(self.config)
             
             # Show sync in progress
-            self.ui.display.clear(0x0000)
-            self.ui.draw_text_centered("Syncing Time...", 200, 2, 0xFFFF)
-            self.ui.draw_text_centered("Please wait", 240, 1, 0x7BEF)
+            self.ui.display.clear(_BLACK)
+            self.ui.draw_text_centered("Syncing Time...", 200, 2, _WHITE)
+            self.ui.draw_text_centered("Please wait", 240, 1, _DIM)
             
             # Attempt sync
             if wifi_sync.auto_sync_time():
                 # Success
-                self.ui.display.clear(0x0000)
-                self.ui.draw_text_centered("Time Sync", 180, 2, 0x07E0)  # Green
-                self.ui.draw_text_centered("Successful!", 220, 2, 0x07E0)
-                print("Manual time sync successful")
+                self.ui.display.clear(_BLACK)
+                self.ui.draw_text_centered("Time Sync", 180, 2, _GREEN)
+                self.ui.draw_text_centered("Successful!", 220, 2, _GREEN)
+                if _DEBUG:
+                    print("Manual time sync successful")
             else:
                 # Failed
-                self.ui.display.clear(0x0000)
-                self.ui.draw_text_centered("Time Sync", 180, 2, 0xF800)  # Red
-                self.ui.draw_text_centered("Failed", 220, 2, 0xF800)
-                self.ui.draw_text_centered("Check WiFi", 260, 1, 0x7BEF)
-                print("Manual time sync failed")
+                self.ui.display.clear(_BLACK)
+                self.ui.draw_text_centered("Time Sync", 180, 2, _RED)
+                self.ui.draw_text_centered("Failed", 220, 2, _RED)
+                self.ui.draw_text_centered("Check WiFi", 260, 1, _DIM)
+                if _DEBUG:
+                    print("Manual time sync failed")
                 
         except Exception as e:
             # Error
-            self.ui.display.clear(0x0000)
-            self.ui.draw_text_centered("Time Sync", 180, 2, 0xF800)  # Red
-            self.ui.draw_text_centered("Error", 220, 2, 0xF800)
-            self.ui.draw_text_centered(str(e)[:20], 260, 1, 0x7BEF)
+            self.ui.display.clear(_BLACK)
+            self.ui.draw_text_centered("Time Sync", 180, 2, _RED)
+            self.ui.draw_text_centered("Error", 220, 2, _RED)
+            self.ui.draw_text_centered(str(e)[:20], 260, 1, _DIM)
             print(f"Time sync error: {e}")
         
         # Wait for user to see result
@@ -396,7 +611,8 @@ class SimpleSettings:
     
     def show_wifi_setup(self):
         """Show WiFi setup interface"""
-        print("Opening WiFi setup...")
+        if _DEBUG:
+            print("Opening WiFi setup...")
         
         # Get current WiFi status
         current_ssid = self.config.get('wifi_ssid', 'Not Set')
@@ -410,6 +626,7 @@ class SimpleSettings:
             "Back to Settings"
         ]
         
+        last_wifi = len(wifi_items) - 1
         selected_wifi = 0
         last_selected = -1
         
@@ -417,8 +634,8 @@ class SimpleSettings:
             # Draw WiFi menu
             if selected_wifi != last_selected:
                 try:
-                    self.ui.display.clear(0x0000)
-                    self.ui.draw_text_centered("WiFi Setup", 20, 2, 0xFFFF)
+                    self.ui.display.clear(_BLACK)
+                    self.ui.draw_text_centered("WiFi Setup", 20, 2, _WHITE)
                     
                     y_start = 80
                     item_height = 40
@@ -428,10 +645,10 @@ class SimpleSettings:
                         
                         if i == selected_wifi:
                             # Highlight selected
-                            self.ui.display.fill_rect(10, y_pos - 5, 300, item_height - 5, 0x001F)
-                            color = 0xFFFF
+                            self.ui.display.fill_rect(MENU_ROW_X, y_pos - 5, MENU_ROW_WIDTH, item_height - 5, _BLUE)
+                            color = _WHITE
                         else:
-                            color = 0xC618
+                            color = _GREY
                         
                         self.ui.draw_text_centered(item, y_pos + 5, 1, color)
                     
@@ -444,17 +661,23 @@ class SimpleSettings:
             input_result = self.wait_for_input(timeout_ms=100)
             
             if input_result == 'up':
-                selected_wifi = (selected_wifi - 1) % len(wifi_items)
+                selected_wifi -= 1
+                if selected_wifi < 0:
+                    selected_wifi = last_wifi
             elif input_result == 'down':
-                selected_wifi = (selected_wifi + 1) % len(wifi_items)
+                selected_wifi += 1
+                if selected_wifi > last_wifi:
+                    selected_wifi = 0
             elif input_result == 'select':
                 if selected_wifi == 0:  # SSID
-                    print("SSID setting not implemented - use wifi_config.py")
+                    if _DEBUG:
+                        print("SSID setting not implemented - use wifi_config.py")
                 elif selected_wifi == 1:  # Password
-                    print("Password setting not implemented - use wifi_config.py")
+                    if _DEBUG:
+                        print("Password setting not implemented - use wifi_config.py")
                 elif selected_wifi == 2:  # NTP Sync toggle
-                    current = self.config.get('ntp_enabled', True)
-                    self.config.set('ntp_enabled', not current)
+                    current = self._cfg_cache.get('ntp_enabled', True)
+                    self._set('ntp_enabled', not current)
                     wifi_items[2] = f"NTP Sync: {'ON' if not current else 'OFF'}"
                 elif selected_wifi == 3:  # Test Connection
                     self.test_wifi_connection()
@@ -465,11 +688,12 @@ class SimpleSettings:
     
     def test_wifi_connection(self):
         """Test WiFi connectivity"""
-        print("Testing WiFi connection...")
+        if _DEBUG:
+            print("Testing WiFi connection...")
         
         try:
-            self.ui.display.clear(0x0000)
-            self.ui.draw_text_centered("Testing WiFi...", 200, 2, 0xFFFF)
+            self.ui.display.clear(_BLACK)
+            self.ui.draw_text_centered("Testing WiFi...", 200, 2, _WHITE)
             
             # Import network module
             import network
@@ -477,23 +701,25 @@ class SimpleSettings:
             
             if wlan.isconnected():
                 # Connected
-                self.ui.display.clear(0x0000)
-                self.ui.draw_text_centered("WiFi Connected", 180, 2, 0x07E0)  # Green
+                self.ui.display.clear(_BLACK)
+                self.ui.draw_text_centered("WiFi Connected", 180, 2, _GREEN)
                 ip = wlan.ifconfig()[0]
-                self.ui.draw_text_centered(f"IP: {ip}", 220, 1, 0x7BEF)
-                print(f"WiFi connected, IP: {ip}")
+                self.ui.draw_text_centered(f"IP: {ip}", 220, 1, _DIM)
+                if _DEBUG:
+                    print(f"WiFi connected, IP: {ip}")
             else:
                 # Not connected
-                self.ui.display.clear(0x0000)
-                self.ui.draw_text_centered("WiFi Not", 180, 2, 0xF800)  # Red
-                self.ui.draw_text_centered("Connected", 220, 2, 0xF800)
-                print("WiFi not connected")
+                self.ui.display.clear(_BLACK)
+                self.ui.draw_text_centered("WiFi Not", 180, 2, _RED)
+                self.ui.draw_text_centered("Connected", 220, 2, _RED)
+                if _DEBUG:
+                    print("WiFi not connected")
                 
         except Exception as e:
             # Error
-            self.ui.display.clear(0x0000)
-            self.ui.draw_text_centered("WiFi Test", 180, 2, 0xF800)  # Red
-            self.ui.draw_text_centered("Error", 220, 2, 0xF800)
+            self.ui.display.clear(_BLACK)
+            self.ui.draw_text_centered("WiFi Test", 180, 2, _RED)
+            self.ui.draw_text_centered("Error", 220, 2, _RED)
             print(f"WiFi test error: {e}")
         
         # Wait for user to see result
@@ -64,6 +64,11 @@ class ST7796:
         self.height = height
         self.rotation = rotation
         
+        # One display line of RGB565 pixels, reused by every fill
+        self._line_buf = bytearray(width * 2)
+        self._line_mv = memoryview(self._line_buf)
+        self._line_color = -1
+        
         # Initialize pins
         self.cs.init(self.cs.OUT, value=1)
         self.dc.init(self.dc.OUT, value=0)
@@ -210,41 +215,65 @@ class ST7796:
             self.set_window(x, y, x, y)
             self.write_data(bytearray([(color >> 8) & 0xFF, color & 0xFF]))
             
-    def fill_rect(self, x, y, w, h, color):
-        """Fill rectangle with color"""
-        if x < 0 or y < 0 or x + w > self.width or y + h > self.height:
+    def _prepare_line(self, color):
+        """Fill the shared line buffer with color (skipped if already that color)"""
+        if color == self._line_color:
             return
             
-        self.set_window(x, y, x + w - 1, y + h - 1)
-        
-        # Prepare color data
+        buf = self._line_buf
         color_high = (color >> 8) & 0xFF
         color_low = color & 0xFF
-        
-        # Send color data
+        for i in range(0, len(buf), 2):
+            buf[i] = color_high
+            buf[i + 1] = color_low
+        self._line_color = color
+        
+    def _begin_write(self, x, y, w, h):
+        """
+        Open a w x h RAM write at (x, y) and leave CS asserted for pixel data
+        Returns False (and writes nothing) if the area is off screen
+        """
+        if x < 0 or y < 0 or x + w > self.width or y + h > self.height:
+            return False
+            
+        self.set_window(x, y, x + w - 1, y + h - 1)
         self.cs(0)
         self.dc(1)
+        return True
         
-        # Send in chunks for better performance
-        chunk_size = 512
-        chunk = bytearray(chunk_size)
-        for i in range(0, chunk_size, 2):
-            chunk[i] = color_high
-            chunk[i + 1] = color_low
+    def blit(self, x, y, w, h, buf):
+        """Write a prebuilt RGB565 buffer (w * h * 2 bytes) to the display"""
+        if not self._begin_write(x, y, w, h):
+            return
             
-        pixels = w * h
-        full_chunks = pixels * 2 // chunk_size
+        self.spi.write(buf)
+        self.cs(1)
+        
+    def fill_rect(self, x, y, w, h, color):
+        """Fill rectangle with color"""
+        self._prepare_line(color)
+        if not self._begin_write(x, y, w, h):
+            return
+        
+        # Stream the preallocated line buffer; no per-call allocation
+        chunk_size = len(self._line_buf)
+        total = w * h * 2
+        full_chunks = total // chunk_size
         
         for _ in range(full_chunks):
-            self.spi.write(chunk)
+            self.spi.write(self._line_buf)
             
         # Send remaining pixels
-        remaining = (pixels * 2) % chunk_size
+        remaining = total % chunk_size
         if remaining:
-            self.spi.write(chunk[:remaining])
+            self.spi.write(self._line_mv[:remaining])
             
         self.cs(1)
         
+    def fill(self, color):
+        """Fill the whole screen with color, one display line per SPI write"""
+        self.fill_rect(0, 0, self.width, self.height, color)
+        
     def draw_rect(self, x, y, w, h, color):
         """Draw rectangle outline"""
         self.draw_hline(x, y, w, color)
@@ -6,6 +6,11 @@ Handles display layout and touch interactions
 from lib.st7796 import *
 from lib.font import Font
 
+# Settings menu layout (adjusted for bottom navigation)
+SETTINGS_Y_START = 60
+SETTINGS_ITEM_HEIGHT = 30  # Reduced height to fit more items
+SETTINGS_MAX_ITEMS = 6     # Limit items shown at once
+
 class UIManager:
     def __init__(self, display, touch, width, height):
         self.display = display
@@ -627,7 +632,7 @@ class UIManager:
         """Draw a single character"""
         self.font.draw_char(self.display, char, x, y, size, color)
     
-    def draw_settings_menu(self, settings_items, selected_index, config):
+    def draw_settings_menu(self, names, keys, selected_index, config):
         """Draw navigable settings menu"""
         self.display.clear(self.bg_color)
         
@@ -635,30 +640,8 @@ class UIManager:
         self.draw_text_centered("Settings", 20, 2, self.primary_color)
         
         # Menu items (adjusted for bottom navigation)
-        y_start = 60
-        item_height = 30  # Reduced height to fit more items
-        max_items = 6     # Limit items shown at once
-        
-        for i, item in enumerate(settings_items[:max_items]):
-            y_pos = y_start + (i * item_height)
-            
-            # Highlight selected item
-            if i == selected_index:
-                self.display.fill_rect(5, y_pos - 3, self.width - 10, item_height - 3, self.primary_color)
-                text_color = BLACK
-            else:
-                text_color = self.secondary_color
-            
-            # Item name
-            self.draw_text(item['name'], 15, y_pos, 1, text_color)
-            
-            # Current value
-            if item['key'] != 'exit':
-                current_value = config.get(item['key'], 'N/A')
-                value_text = str(current_value)
-                if len(value_text) > 12:
-                    value_text = value_text[:10] + "..."
-                self.draw_text(value_text, 180, y_pos, 1, text_color)
+        for i in range(min(len(keys), SETTINGS_MAX_ITEMS)):
+            self.draw_settings_row(names[i], keys[i], i, i == selected_index, config, clear=False)
         
         # Instructions (moved higher to avoid navigation)
         self.draw_text_centered("Navigate: Joystick/Buttons", 
@@ -667,6 +650,37 @@ class UIManager:
         # Bottom navigation
         self.draw_bottom_navigation('settings')
     
+    def draw_settings_row(self, name, key, index, selected, config, clear=True):
+        """Draw one settings menu row (clear=False skips the background on a fresh screen)"""
+        y_pos = SETTINGS_Y_START + (index * SETTINGS_ITEM_HEIGHT)
+        
+        # Highlight selected item
+        if selected:
+            self.display.fill_rect(5, y_pos - 3, self.width - 10, SETTINGS_ITEM_HEIGHT - 3, self.primary_color)
+            text_color = BLACK
+        else:
+            if clear:
+                self.display.fill_rect(5, y_pos - 3, self.width - 10, SETTINGS_ITEM_HEIGHT - 3, self.bg_color)
+            text_color = self.secondary_color
+        
+        # Item name
+        self.draw_text(name, 15, y_pos, 1, text_color)
+        
+        # Current value
+        if key != 'exit':
+            current_value = config.get(key, 'N/A')
+            value_text = str(current_value)
+            if len(value_text) > 12:
+                value_text = value_text[:10] + "..."
+            self.draw_text(value_text, 180, y_pos, 1, text_color)
+            
+    def redraw_settings_row(self, names, keys, old_index, new_index, config):
+        """Move the settings highlight by repainting only the two affected rows"""
+        if 0 <= old_index < SETTINGS_MAX_ITEMS:
+            self.draw_settings_row(names[old_index], keys[old_index], old_index, False, config)
+        if 0 <= new_index < SETTINGS_MAX_ITEMS:
+            self.draw_settings_row(names[new_index], keys[new_index], new_index, True, config)
+    
     def draw_number_editor(self, setting_name, current_value):
         """Draw number editor interface"""
         self.display.clear(self.bg_color)
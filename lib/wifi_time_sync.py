@@ -47,12 +47,12 @@ class WiFiTimeSync:
         self.wlan.connect(wifi_ssid, wifi_password)
         
         # Wait for connection
-        start_time = time.time()
+        start_time = time.ticks_ms()
         while not self.wlan.isconnected():
-            if time.time() - start_time > timeout:
+            if time.ticks_diff(time.ticks_ms(), start_time) > timeout * 1000:
                 print("WiFi: Connection timeout")
                 return False
-            time.sleep(0.5)
+            time.sleep_ms(500)
             print(".", end="")
         
         print(f"\nWiFi: Connected! IP: {self.wlan.ifconfig()[0]}")
@@ -135,9 +135,9 @@ class MuslimCompanion:
             else:
                 return f"{hour:02d}:{minute:02d}"
     
-    def update_prayer_times(self):
-        """Calculate prayer times for current day"""
-        return self.prayer_calc.update_prayer_times()
+    def update_prayer_times(self, force=False):
+        """Calculate prayer times for current day (force skips the RTC check throttle)"""
+        return self.prayer_calc.update_prayer_times(force)
             
     def get_next_prayer(self):
         """Determine the next prayer time"""
@@ -148,15 +148,15 @@ class MuslimCompanion:
         # Update button states
         self.buttons.update()
         # Small delay to help with button detection
-        time.sleep(0.01)
+        time.sleep_ms(10)
         
         # Check if any input should wake from sleep
         input_detected = False
         
-        # Check legacy settings button (GP12)
-        if self.hw.check_legacy_button():
+        # Long press on button 2 opens settings from any tab
+        if self.buttons.get_back_long_press():
             input_detected = True
-            print("Legacy button (GP12) pressed - Opening settings")
+            print("Button 2 (GP15) long pressed - Opening settings")
             result = self.show_settings()
             if result == True:
                 self.update_display()
@@ -223,7 +223,7 @@ class MuslimCompanion:
             input_detected = True
             if self.current_tab == 'prayer':
                 # Refresh prayer times
-                self.update_prayer_times()
+                self.update_prayer_times(force=True)
                 self.update_display()
             elif self.current_tab == 'hijri':
                 # Refresh Hijri data
@@ -280,7 +280,7 @@ class MuslimCompanion:
                             self.switch_tab(result)
                     elif action == 'refresh':
                         if self.current_tab == 'prayer':
-                            self.update_prayer_times()
+                            self.update_prayer_times(force=True)
                             self.update_display()
                         elif self.current_tab == 'hijri':
                             self.update_display()
@@ -527,8 +527,10 @@ class MuslimCompanion:
                     last_second = second
                     gc.collect()  # Manage memory
                 
-                # Full screen refresh every minute or when needed
+                # Full screen refresh every minute or when needed; re-check the
+                # (day, timezone) key first so a DST change-over shows at once
                 if minute != last_minute or screen_needs_refresh:
+                    self.update_prayer_times()
                     self.update_display()
                     last_minute = minute
                     screen_needs_refresh = False
@@ -547,7 +549,7 @@ class MuslimCompanion:
                 
                 # Update prayer times at midnight (and refresh screen)
                 if hour == 0 and minute == 0 and second == 0:
-                    self.update_prayer_times()
+                    self.update_prayer_times(force=True)
                     screen_needs_refresh = True
                 
                 # Check for scheduled time sync (once per hour at minute 0)
@@ -559,7 +561,7 @@ class MuslimCompanion:
                     except Exception as e:
                         print(f"Scheduled sync error: {e}")
                 
-                time.sleep(0.05)  # Reduced for better responsiveness
+                time.sleep_ms(50)  # Reduced for better responsiveness
                 
             except Exception as e:
                 print(f"Error in main loop: {e}")
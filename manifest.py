@@ -0,0 +1,45 @@
+"""
+MicroPython Firmware Manifest for Muslim Companion
+Freezes the hardware selection and the whole lib package into the firmware
+
+Build from the MicroPython source tree:
+    cd ports/rp2
+    make BOARD=RPI_PICO2_W FROZEN_MANIFEST=/path/to/pico-muslim-prayers/manifest.py
+
+Frozen modules run straight from flash: no .py parse at boot and no
+heap used for their bytecode. Do not also copy them to the board's
+filesystem - a file there shadows the frozen copy. lib must be frozen
+as a whole: a /lib directory on the filesystem comes first on sys.path
+and MicroPython does not merge one package across path entries, so any
+lib module missing from it would fail to import.
+"""
+
+# Keep everything the board normally freezes (networking, asyncio, ...)
+include("$(BOARD_DIR)/manifest.py")
+
+# Hardware selection
+module("hardware_config.py")
+
+# Every lib module: DST rules, drivers, the GeeekPi hardware abstraction,
+# prayer/Hijri calculations, UI and WiFi time sync
+package("lib", files=(
+    "dst_utils.py",
+    "display_helper.py",
+    "font.py",
+    "buttons.py",
+    "joystick.py",
+    "st7796.py",
+    "gt911.py",
+    "safe_touch.py",
+    "geekpi_gpio.py",
+    "prayer_times.py",
+    "hijri_calendar.py",
+    "ui_manager.py",
+    "simple_settings.py",
+    "no_touch_settings.py",
+    "wifi_time_sync.py",
+))
+
+# Settings screens: large and loaded every boot, so keep its bytecode in flash.
+# opt=3 (as mpy-cross -O3) drops asserts and line numbers to shrink it further.
+package("lib", files=("prayer_settings.py",), opt=3)
\ No newline at end of file
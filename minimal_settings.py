@@ -114,7 +114,7 @@ def minimal_settings_test():
                 hw.display.fill(colors[selected])
         
         # Small sleep to prevent overwhelming CPU
-        time.sleep(0.05)
+        time.sleep_ms(50)
 
 if __name__ == "__main__":
     try: